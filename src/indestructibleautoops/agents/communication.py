@@ -11,6 +11,7 @@ import threading
 import time
 import uuid
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from queue import Empty, Queue
 from typing import Any
@@ -135,6 +136,42 @@ class AgentCommunicationBus:
 
             return success
 
+    def multicast(
+        self,
+        recipient_ids: Iterable[str],
+        msg_type: MessageType,
+        sender_id: str,
+        timeout: float = 1.0,
+    ) -> int:
+        """Send a payload-free message of one type to each recipient.
+
+        Takes the bus lock once for the whole batch and stamps every message
+        with the same timestamp. Message IDs are one UUID per batch plus a
+        sequence number, which avoids a uuid4() call per recipient. Returns
+        the number of messages delivered.
+        """
+        batch_id = uuid.uuid4()
+        timestamp = time.time()
+        with self._lock:
+            count = 0
+            for seq, recipient_id in enumerate(recipient_ids):
+                queue = self._queues.get(recipient_id)
+                if not queue:
+                    continue
+
+                message = AgentMessage(
+                    msg_id=f"{batch_id}-{seq}",
+                    msg_type=msg_type,
+                    sender_id=sender_id,
+                    recipient_id=recipient_id,
+                    timestamp=timestamp,
+                )
+                if queue.put_inbound(message, timeout=timeout):
+                    self._add_to_history(message)
+                    count += 1
+
+            return count
+
     def broadcast(
         self,
         message: AgentMessage,
@@ -6,16 +6,113 @@ This agent handles CI/CD pipeline management, GitOps operations, and supply chai
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
+import logging
+import os
+import re
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import yaml
+
 from ..base import Agent, AgentCapability
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+# Language indicator files, checked in priority order
+_TYPE_MARKERS: tuple[tuple[str, str], ...] = (
+    ("requirements.txt", "python"),
+    ("pyproject.toml", "python"),
+    ("package.json", "node"),
+    ("go.mod", "go"),
+    ("pom.xml", "java"),
+    ("Cargo.toml", "rust"),
+)
+
+# ${name} placeholders in CI templates
+_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Custom template file extensions
+_TEMPLATE_EXTENSIONS = (".json", ".yaml", ".yml")
+
+# CI provider -> (generated file path, template getter method)
+_CI_PROVIDERS: dict[str, tuple[str, str]] = {
+    "github": (".github/workflows/ci.yml", "_get_github_actions_template"),
+    "gitlab": (".gitlab-ci.yml", "_get_gitlab_ci_template"),
+    "azure": ("azure-pipelines.yml", "_get_azure_pipelines_template"),
+}
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    # ensure_ascii=False matches orjson's UTF-8 output byte for byte
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _scan_template_files(root: str) -> list[str]:
+    """Collect template file paths under root with an iterative scandir walk.
+
+    Directories that can't be listed are logged and skipped.
+    """
+    paths = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(_TEMPLATE_EXTENSIONS):
+                        paths.append(entry.path)
+        except OSError as e:
+            logging.warning(f"Skipping template directory {directory}: {e}")
+    return paths
+
+
+def _parse_template_file(path: str) -> dict[str, Any] | None:
+    """Parse a custom template file.
+
+    The file holds a mapping with ``content`` and optional ``provider``,
+    ``template_name`` and ``name``. The provider defaults to the containing
+    directory name and the template name to the file stem. Files that can't
+    be read or parsed are logged and skipped.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = f.read()
+        if path.endswith(".json"):
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        else:
+            data = yaml.safe_load(raw)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        logging.warning(f"Skipping template file {path}: {e}")
+        return None
+
+    if not isinstance(data, dict) or not isinstance(data.get("content"), str):
+        return None
+
+    template_name = data.get("template_name") or os.path.splitext(os.path.basename(path))[0]
+    return {
+        "provider": data.get("provider") or os.path.basename(os.path.dirname(path)),
+        "template_name": template_name,
+        "name": data.get("name", template_name),
+        "content": data["content"],
+    }
+
 
-@dataclass
+@dataclass(slots=True)
 class CIPatchSet:
     """A set of CI/CD patches."""
 
@@ -26,8 +123,19 @@ class CIPatchSet:
     status: str
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert patch set to dictionary."""
+        return {
+            "patch_id": self.patch_id,
+            "provider": self.provider,
+            "repository": self.repository,
+            "patches": self.patches,
+            "status": self.status,
+            "metadata": self.metadata,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class AttestationInput:
     """Input for creating attestations."""
 
@@ -36,6 +144,15 @@ class AttestationInput:
     data: dict[str, Any]
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert attestation to dictionary."""
+        return {
+            "attestation_id": self.attestation_id,
+            "type": self.type,
+            "data": self.data,
+            "metadata": self.metadata,
+        }
+
 
 class DeliveryAgent(Agent):
     """Agent for delivery operations (CI/CD, GitOps, supply chain)."""
@@ -74,12 +191,25 @@ class DeliveryAgent(Agent):
 
         super().__init__(agent_id, capabilities, config)
 
-        # Internal state
+        # Internal state. Patch sets and attestations are only ever inserted
+        # under fresh unique keys, so they are written and read without the
+        # lock: single dict stores, lookups and list(d.values()) are atomic
+        # under the CPython GIL. Other interpreters need the lock restored.
         self._ci_patch_sets: dict[str, CIPatchSet] = {}
         self._attestations: dict[str, AttestationInput] = {}
         self._templates: dict[str, dict[str, Any]] = {}
+        # Template content pre-split by _VAR_RE: [literal, var, literal, ...]
+        self._template_segments: dict[str, tuple[str, ...]] = {}
+        # Recently served JSON encodings by ID, least recently used first
+        self._json_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._json_cache_size = self.config.get("json_cache_size", 1024)
         self._lock = threading.RLock()
 
+        # ID minting: one startup timestamp plus a monotonic counter keeps
+        # IDs unique even when many tasks arrive within the same second
+        self._start_ns = time.time_ns()
+        self._id_counter = itertools.count()
+
         # Load default templates
         self._load_default_templates()
 
@@ -95,7 +225,7 @@ class DeliveryAgent(Agent):
         # Save state if configured
         state_dir = self.config.get("state_dir")
         if state_dir:
-            await self._save_state(state_dir)
+            self._save_state(state_dir)
 
     async def execute_task(
         self,
@@ -132,7 +262,6 @@ class DeliveryAgent(Agent):
     ) -> dict[str, Any]:
         """Task: Generate CI/CD configuration files."""
         project_snapshot = payload.get("project_snapshot")
-        repair_plan = payload.get("repair_plan")
         provider = payload.get("provider", "github")
 
         if not project_snapshot:
@@ -142,23 +271,22 @@ class DeliveryAgent(Agent):
         project_type = self._detect_project_type(project_snapshot)
 
         # Generate CI config based on provider and project type
-        patches = []
-        if provider == "github":
-            patches.extend(
-                await self._generate_github_actions(project_type, project_snapshot, repair_plan)
-            )
-        elif provider == "gitlab":
-            patches.extend(
-                await self._generate_gitlab_ci(project_type, project_snapshot, repair_plan)
-            )
-        elif provider == "azure":
-            patches.extend(
-                await self._generate_azure_pipelines(project_type, project_snapshot, repair_plan)
-            )
+        spec = _CI_PROVIDERS.get(provider)
+        if spec:
+            file_path, template_getter = spec
+            patches = [
+                {
+                    "file_path": file_path,
+                    "content": getattr(self, template_getter)(project_type),
+                    "action": "create",
+                },
+            ]
+        else:
+            patches = []
 
         # Create patch set
         patch_set = CIPatchSet(
-            patch_id=f"ci_patch_{int(time.time())}_{self.agent_id}",
+            patch_id=self._next_id("ci_patch"),
             provider=provider,
             repository=project_snapshot.get("project_root", ""),
             patches=patches,
@@ -169,12 +297,11 @@ class DeliveryAgent(Agent):
             },
         )
 
-        with self._lock:
-            self._ci_patch_sets[patch_set.patch_id] = patch_set
+        self._ci_patch_sets[patch_set.patch_id] = patch_set
 
         return {
             "success": True,
-            "patch_set": patch_set.__dict__,
+            "patch_set": patch_set.to_dict(),
         }
 
     async def _task_apply_template(
@@ -191,16 +318,21 @@ class DeliveryAgent(Agent):
             raise ValueError("template_name is required")
 
         template_key = f"{provider}:{template_name}"
-        template = self._templates.get(template_key)
+        segments = self._template_segments.get(template_key)
 
-        if not template:
+        if segments is None:
             raise ValueError(f"Template not found: {template_key}")
 
-        # Apply variables to template
-        ci_config = template["content"]
-
-        for key, value in variables.items():
-            ci_config = ci_config.replace(f"${{{key}}}", str(value))
+        # Apply variables to template; unknown placeholders are kept verbatim.
+        # Templates without placeholders are returned as the stored string.
+        if len(segments) == 1:
+            ci_config = segments[0]
+        else:
+            parts = list(segments)
+            for i in range(1, len(parts), 2):
+                name = parts[i]
+                parts[i] = str(variables[name]) if name in variables else f"${{{name}}}"
+            ci_config = "".join(parts)
 
         return {
             "success": True,
@@ -232,11 +364,11 @@ class DeliveryAgent(Agent):
 
         # Update dependencies based on package manager
         if package_manager == "pip":
-            return await self._update_python_deps(root_path, context)
+            return self._update_python_deps(root_path, context)
         elif package_manager == "npm":
-            return await self._update_node_deps(root_path, context)
+            return self._update_node_deps(root_path, context)
         elif package_manager == "go":
-            return await self._update_go_deps(root_path, context)
+            return self._update_go_deps(root_path, context)
         else:
             raise ValueError(f"Unsupported package manager: {package_manager}")
 
@@ -253,7 +385,7 @@ class DeliveryAgent(Agent):
             raise ValueError("attestation_type is required")
 
         attestation = AttestationInput(
-            attestation_id=f"attestation_{int(time.time())}_{self.agent_id}",
+            attestation_id=self._next_id("attestation"),
             type=attestation_type,
             data=data,
             metadata={
@@ -262,31 +394,28 @@ class DeliveryAgent(Agent):
             },
         )
 
-        with self._lock:
-            self._attestations[attestation.attestation_id] = attestation
+        self._attestations[attestation.attestation_id] = attestation
 
         return {
             "success": True,
-            "attestation": attestation.__dict__,
+            "attestation": attestation.to_dict(),
         }
 
+    def _next_id(self, prefix: str) -> str:
+        """Mint a collision-free ID for a patch set or attestation."""
+        return f"{prefix}_{self._start_ns}_{next(self._id_counter)}_{self.agent_id}"
+
     def _detect_project_type(self, project_snapshot: dict[str, Any]) -> str:
         """Detect project type from snapshot."""
         file_index = project_snapshot.get("file_index", {})
 
-        # Check for language indicators
-        if "requirements.txt" in file_index or "pyproject.toml" in file_index:
-            return "python"
-        elif "package.json" in file_index:
-            return "node"
-        elif "go.mod" in file_index:
-            return "go"
-        elif "pom.xml" in file_index:
-            return "java"
-        elif "Cargo.toml" in file_index:
-            return "rust"
-        else:
-            return "generic"
+        # First language indicator present wins. This is a handful of hash
+        # probes regardless of index size, so it is deliberately not memoized:
+        # building a cache key from the file index would cost O(files).
+        return next(
+            (label for marker, label in _TYPE_MARKERS if marker in file_index),
+            "generic",
+        )
 
     def _detect_package_manager(self, project_root: Path) -> str | None:
         """Detect package manager from project."""
@@ -312,64 +441,7 @@ class DeliveryAgent(Agent):
 
         return None
 
-    async def _generate_github_actions(
-        self,
-        project_type: str,
-        project_snapshot: dict[str, Any],
-        repair_plan: dict[str, Any] | None,
-    ) -> list[dict[str, Any]]:
-        """Generate GitHub Actions configuration."""
-        config = self._get_github_actions_template(project_type)
-
-        patches = [
-            {
-                "file_path": ".github/workflows/ci.yml",
-                "content": config,
-                "action": "create",
-            },
-        ]
-
-        return patches
-
-    async def _generate_gitlab_ci(
-        self,
-        project_type: str,
-        project_snapshot: dict[str, Any],
-        repair_plan: dict[str, Any] | None,
-    ) -> list[dict[str, Any]]:
-        """Generate GitLab CI configuration."""
-        config = self._get_gitlab_ci_template(project_type)
-
-        patches = [
-            {
-                "file_path": ".gitlab-ci.yml",
-                "content": config,
-                "action": "create",
-            },
-        ]
-
-        return patches
-
-    async def _generate_azure_pipelines(
-        self,
-        project_type: str,
-        project_snapshot: dict[str, Any],
-        repair_plan: dict[str, Any] | None,
-    ) -> list[dict[str, Any]]:
-        """Generate Azure Pipelines configuration."""
-        config = self._get_azure_pipelines_template(project_type)
-
-        patches = [
-            {
-                "file_path": "azure-pipelines.yml",
-                "content": config,
-                "action": "create",
-            },
-        ]
-
-        return patches
-
-    async def _update_python_deps(
+    def _update_python_deps(
         self,
         project_root: Path,
         context: dict[str, Any],
@@ -401,7 +473,7 @@ class DeliveryAgent(Agent):
             "error": "No requirements.txt found",
         }
 
-    async def _update_node_deps(
+    def _update_node_deps(
         self,
         project_root: Path,
         context: dict[str, Any],
@@ -421,7 +493,7 @@ class DeliveryAgent(Agent):
             "error": "No package.json found",
         }
 
-    async def _update_go_deps(
+    def _update_go_deps(
         self,
         project_root: Path,
         context: dict[str, Any],
@@ -540,54 +612,95 @@ steps:
     def _load_default_templates(self) -> None:
         """Load default CI/CD templates."""
         # GitHub Actions templates
-        self._templates["github:python"] = {
-            "name": "Python CI",
-            "content": self._get_github_actions_template("python"),
-        }
-        self._templates["github:node"] = {
-            "name": "Node.js CI",
-            "content": self._get_github_actions_template("node"),
-        }
-        self._templates["github:go"] = {
-            "name": "Go CI",
-            "content": self._get_github_actions_template("go"),
-        }
+        self._add_template(
+            "github:python", "Python CI", self._get_github_actions_template("python")
+        )
+        self._add_template("github:node", "Node.js CI", self._get_github_actions_template("node"))
+        self._add_template("github:go", "Go CI", self._get_github_actions_template("go"))
 
         # GitLab CI templates
-        self._templates["gitlab:default"] = {
-            "name": "Default CI",
-            "content": self._get_gitlab_ci_template("python"),
-        }
+        self._add_template("gitlab:default", "Default CI", self._get_gitlab_ci_template("python"))
 
         # Azure Pipelines templates
-        self._templates["azure:default"] = {
-            "name": "Default Pipeline",
-            "content": self._get_azure_pipelines_template("python"),
-        }
+        self._add_template(
+            "azure:default", "Default Pipeline", self._get_azure_pipelines_template("python")
+        )
+
+    def _add_template(self, key: str, name: str, content: str) -> None:
+        """Register a template and pre-split it for variable substitution."""
+        self._templates[key] = {"name": name, "content": content}
+        self._template_segments[key] = tuple(_VAR_RE.split(content))
 
     async def _load_templates_from_dir(self, templates_dir: str) -> None:
-        """Load custom templates from directory."""
-        # Implementation would load YAML/JSON templates
-        pass
+        """Load custom YAML/JSON templates from directory.
+
+        Files are parsed concurrently in worker threads; custom templates
+        override built-in ones with the same key. A missing directory loads
+        nothing.
+        """
+        if not os.path.isdir(templates_dir):
+            logging.warning(f"Templates directory not found: {templates_dir}")
+            return
+
+        paths = await asyncio.to_thread(_scan_template_files, templates_dir)
+        parsed = await asyncio.gather(
+            *(asyncio.to_thread(_parse_template_file, path) for path in paths)
+        )
 
-    async def _save_state(self, state_dir: str) -> None:
+        with self._lock:
+            for template in parsed:
+                if template is not None:
+                    self._add_template(
+                        f"{template['provider']}:{template['template_name']}",
+                        template["name"],
+                        template["content"],
+                    )
+
+    def _save_state(self, state_dir: str) -> None:
         """Save agent state."""
         pass
 
     def get_patch_set(self, patch_id: str) -> CIPatchSet | None:
         """Get a CI patch set by ID."""
-        with self._lock:
-            return self._ci_patch_sets.get(patch_id)
+        return self._ci_patch_sets.get(patch_id)
 
     def list_patch_sets(self) -> list[CIPatchSet]:
         """List all CI patch sets."""
-        with self._lock:
-            return list(self._ci_patch_sets.values())
+        return list(self._ci_patch_sets.values())
+
+    def get_patch_set_json(self, patch_id: str) -> bytes | None:
+        """Get a CI patch set serialized as JSON bytes.
+
+        The encoding is computed on first request and reused afterwards; only
+        the ``json_cache_size`` most recently served encodings are kept.
+        """
+        return self._get_json(patch_id, self.get_patch_set(patch_id))
 
     def get_attestation(self, attestation_id: str) -> AttestationInput | None:
         """Get an attestation by ID."""
+        return self._attestations.get(attestation_id)
+
+    def get_attestation_json(self, attestation_id: str) -> bytes | None:
+        """Get an attestation serialized as JSON bytes (cached like patch sets)."""
+        return self._get_json(attestation_id, self.get_attestation(attestation_id))
+
+    def _get_json(self, key: str, item: CIPatchSet | AttestationInput | None) -> bytes | None:
+        """Return the cached JSON encoding of a stored item."""
+        if item is None:
+            return None
+        cache = self._json_cache
+        with self._lock:
+            encoded = cache.get(key)
+            if encoded is not None:
+                cache.move_to_end(key)
+                return encoded
+
+        encoded = _dumps(item.to_dict())
         with self._lock:
-            return self._attestations.get(attestation_id)
+            cache[key] = encoded
+            if len(cache) > self._json_cache_size:
+                cache.popitem(last=False)
+        return encoded
 
     def list_templates(self, provider: str | None = None) -> list[dict[str, Any]]:
         """List available templates."""
@@ -6,16 +6,139 @@ This agent handles event stream processing, metrics collection, and report gener
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import itertools
+import logging
+import operator
 import threading
 import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from ..base import Agent, AgentCapability
 
+try:
+    import numpy as np
+except ImportError:  # optional: large batches fall back to the Python loop
+    np = None
 
-@dataclass
+T = TypeVar("T")
+
+# Appended to event strings cut at ingestion
+_TRUNCATED = "...[truncated]"
+
+# Width of the metric time buckets
+_BUCKET_SECONDS = 60
+
+# Sequence suffix that keeps metric, alert and report IDs unique within a second
+_ID_SEQ = itertools.count()
+
+# Batches larger than this are aggregated with NumPy when it is installed
+_VECTORIZE_THRESHOLD = 1000
+
+# Alert rule condition -> comparator(metric_value, threshold)
+_CONDITIONS: dict[str, Callable[[Any, Any], bool]] = {
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+
+# (name, value) of a metric in one C-level call
+_name_and_value = operator.attrgetter("name", "value")
+
+# Alerts report section order; other severities follow alphabetically
+_SEVERITY_ORDER = ("critical", "high", "warning", "info")
+
+# Report types understood by generate_report
+_REPORT_TYPES = frozenset({"summary", "metrics", "alerts", "execution"})
+
+
+def _recent(newest_first: Iterable[T], limit: int) -> list[T]:
+    """Take up to ``limit`` items from a newest-first iterable, oldest first."""
+    recent = list(itertools.islice(newest_first, limit))
+    recent.reverse()
+    return recent
+
+
+def _accumulate(stats: list[float], value: float) -> None:
+    """Fold a value into running [count, sum, min, max] stats."""
+    stats[0] += 1
+    stats[1] += value
+    if value < stats[2]:
+        stats[2] = value
+    if value > stats[3]:
+        stats[3] = value
+
+
+def _stats_summary(stats: list[float]) -> dict[str, float]:
+    """Expand running [count, sum, min, max] stats into a summary dict."""
+    count, total, low, high = stats
+    return {"count": count, "sum": total, "min": low, "max": high, "avg": total / count}
+
+
+def _aggregate_vectorized(metrics: list[Metric]) -> dict[str, dict[str, float]]:
+    """Aggregate a large metric batch by name with NumPy reductions.
+
+    Produces the same shape and name order as the pure-Python path.
+    """
+    names = np.array([m.name for m in metrics])
+    values = np.fromiter((m.value for m in metrics), dtype=np.float64, count=len(metrics))
+
+    unique, first_seen, inverse = np.unique(names, return_index=True, return_inverse=True)
+    counts = np.bincount(inverse)
+    sums = np.bincount(inverse, weights=values)
+
+    # Group values contiguously by name for the min/max segment reductions
+    grouped = values[np.argsort(inverse, kind="stable")]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    mins = np.minimum.reduceat(grouped, starts)
+    maxs = np.maximum.reduceat(grouped, starts)
+
+    aggregated = {}
+    for i in np.argsort(first_seen).tolist():
+        count = int(counts[i])
+        total = float(sums[i])
+        aggregated[str(unique[i])] = {
+            "count": count,
+            "sum": total,
+            "min": float(mins[i]),
+            "max": float(maxs[i]),
+            "avg": total / count,
+        }
+    return aggregated
+
+
+def _truncate_strings(value: Any, limit: int) -> Any:
+    """Cut strings longer than ``limit`` inside nested dicts and lists.
+
+    Containers are copied only when something inside them was cut, so
+    events without oversized fields are returned as-is.
+    """
+    if isinstance(value, str):
+        return value[:limit] + _TRUNCATED if len(value) > limit else value
+    if isinstance(value, dict):
+        copied = None
+        for key, item in value.items():
+            cut = _truncate_strings(item, limit)
+            if cut is not item:
+                if copied is None:
+                    copied = dict(value)
+                copied[key] = cut
+        return value if copied is None else copied
+    if isinstance(value, list):
+        cut_items = [_truncate_strings(item, limit) for item in value]
+        if any(cut is not item for cut, item in zip(cut_items, value, strict=True)):
+            return cut_items
+        return value
+    return value
+
+
+@dataclass(slots=True)
 class Metric:
     """A metric data point."""
 
@@ -27,8 +150,20 @@ class Metric:
     tags: dict[str, str] = field(default_factory=dict)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metric to dictionary."""
+        return {
+            "metric_id": self.metric_id,
+            "name": self.name,
+            "value": self.value,
+            "unit": self.unit,
+            "timestamp": self.timestamp,
+            "tags": self.tags,
+            "metadata": self.metadata,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Alert:
     """An alert generated from metrics or events."""
 
@@ -42,8 +177,22 @@ class Alert:
     timestamp: float = field(default_factory=time.time)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert alert to dictionary."""
+        return {
+            "alert_id": self.alert_id,
+            "severity": self.severity,
+            "title": self.title,
+            "description": self.description,
+            "metric_name": self.metric_name,
+            "threshold": self.threshold,
+            "current_value": self.current_value,
+            "timestamp": self.timestamp,
+            "metadata": self.metadata,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Report:
     """A generated report."""
 
@@ -55,6 +204,18 @@ class Report:
     format: str = "markdown"
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert report to dictionary."""
+        return {
+            "report_id": self.report_id,
+            "report_type": self.report_type,
+            "title": self.title,
+            "content": self.content,
+            "generated_at": self.generated_at,
+            "format": self.format,
+            "metadata": self.metadata,
+        }
+
 
 class ObservabilityAgent(Agent):
     """Agent for observability operations (events, metrics, reports)."""
@@ -93,16 +254,61 @@ class ObservabilityAgent(Agent):
 
         super().__init__(agent_id, capabilities, config)
 
-        # Internal state
-        self._metrics: list[Metric] = []
-        self._alerts: list[Alert] = []
-        self._reports: list[Report] = []
-        self._event_buffer: list[dict[str, Any]] = []
+        # Internal state, bounded so long-running agents keep constant memory
+        cfg = self.config
+        self._metrics: deque[Metric] = deque(maxlen=cfg.get("max_metrics", 100_000))
+        self._alerts: deque[Alert] = deque(maxlen=cfg.get("max_alerts", 10_000))
+        self._alerts_by_severity: defaultdict[str, deque[Alert]] = defaultdict(
+            lambda: deque(maxlen=cfg.get("max_alerts_per_severity", 200))
+        )
+        self._reports: dict[str, Report] = {}
+        self._max_reports = cfg.get("max_reports", 1_000)
+        self._event_buffer: deque[dict[str, Any]] = deque(
+            maxlen=cfg.get("max_event_buffer", 10_000)
+        )
+        # Longer string fields in ingested events are cut (0 disables)
+        self._max_event_field_length = cfg.get("max_event_field_length", 4096)
 
         self._alert_rules: dict[str, dict[str, Any]] = {}
-        self._metric_aggregates: dict[str, dict[str, Any]] = {}
+        # metric_name -> [(rule_name, rule, comparator)], rebuilt whenever rules change
+        self._rules_by_metric: dict[str, list[tuple[str, dict[str, Any], Callable]]] = {}
+        # Lifetime [count, sum, min, max] per stored metric name
+        self._metric_aggregates: dict[str, list[float]] = {}
+        # Last `metrics_window` values per name, with their [count, sum, min, max]
+        self._metrics_window = cfg.get("metrics_window", 100)
+        self._windows: dict[str, deque[float]] = {}
+        self._window_stats: dict[str, list[float]] = {}
+        # Ring of per-minute buckets (by ingestion time) for "last N minutes"
+        # queries: (minute, metrics in order, metrics by name). Buckets only
+        # hold metrics still in history.
+        self._metric_buckets: deque[tuple[int, deque[Metric], dict[str, deque[Metric]]]] = deque(
+            maxlen=cfg.get("metric_buckets", 60)
+        )
 
-        self._lock = threading.RLock()
+        # Per-collection locks, only for read-modify-write sequences and
+        # for iterating deques (which must not be appended to mid-iteration).
+        # Plain appends to the event buffer and single dict reads are atomic
+        # under the CPython GIL and take no lock. Alert rules are
+        # copy-on-write, so readers never lock them.
+        self._metrics_lock = threading.Lock()
+        self._alerts_lock = threading.Lock()
+        self._reports_lock = threading.Lock()
+        self._rules_lock = threading.Lock()
+
+        # Background report generation, started by initialize() when enabled
+        self._report_queue: asyncio.Queue | None = None
+        self._report_worker_task: asyncio.Task | None = None
+        # Queued report IDs, and the IDs of failed ones (oldest evicted past max_reports)
+        self._report_jobs: dict[str, str] = {}
+        self._failed_reports: dict[str, None] = {}
+
+        # Task type -> handler
+        self._task_handlers = {
+            "process_events": self._task_process_events,
+            "collect_metrics": self._task_collect_metrics,
+            "generate_report": self._task_generate_report,
+            "check_alerts": self._task_check_alerts,
+        }
 
         # Load default alert rules
         self._load_default_alert_rules()
@@ -113,8 +319,22 @@ class ObservabilityAgent(Agent):
         if self.config.get("aggregate_metrics", True):
             self._start_aggregation_timer()
 
+        # Move report generation to a worker task if configured
+        if self.config.get("background_reports", False):
+            self._report_queue = asyncio.Queue()
+            self._report_worker_task = asyncio.create_task(self._report_worker())
+
     async def shutdown(self) -> None:
         """Shutdown the observability agent."""
+        # Finish queued reports before stopping the worker
+        if self._report_worker_task is not None:
+            await self._report_queue.join()
+            self._report_worker_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._report_worker_task
+            self._report_worker_task = None
+            self._report_queue = None
+
         # Save metrics and reports if configured
         state_dir = self.config.get("state_dir")
         if state_dir:
@@ -130,16 +350,10 @@ class ObservabilityAgent(Agent):
         payload = task.get("payload", {})
 
         try:
-            if task_type == "process_events":
-                return await self._task_process_events(payload, context)
-            elif task_type == "collect_metrics":
-                return await self._task_collect_metrics(payload, context)
-            elif task_type == "generate_report":
-                return await self._task_generate_report(payload, context)
-            elif task_type == "check_alerts":
-                return await self._task_check_alerts(payload, context)
-            else:
+            handler = self._task_handlers.get(task_type)
+            if handler is None:
                 raise ValueError(f"Unknown task type: {task_type}")
+            return await handler(payload, context)
 
         except Exception as e:
             return {
@@ -164,27 +378,34 @@ class ObservabilityAgent(Agent):
                 "alerts": [],
             }
 
-        metrics_generated = []
-        alerts_generated = []
+        # Cap per-event memory before anything keeps a reference to the events
+        if self._max_event_field_length:
+            limit = self._max_event_field_length
+            event_stream = [_truncate_strings(event, limit) for event in event_stream]
 
-        for event in event_stream:
-            # Add to event buffer
-            with self._lock:
-                self._event_buffer.append(event)
+        # Buffer the whole batch at once; the ring drops the oldest events
+        buffer = self._event_buffer
+        dropped = max(0, len(buffer) + len(event_stream) - buffer.maxlen)
+        buffer.extend(event_stream)
 
-            # Extract metrics from event
-            event_metrics = await self._extract_metrics_from_event(event)
-            metrics_generated.extend(event_metrics)
+        # One timestamp for the whole batch, used where events carry none
+        now = time.time()
 
-            # Check for alerts
-            event_alerts = await self._check_event_alerts(event)
-            alerts_generated.extend(event_alerts)
+        # Extract metrics and check for alerts in one pass each over the batch
+        # Metrics go straight out as dicts; alerts are stored, so they stay objects
+        extract = self._extract_metric_dicts_from_event
+        check = self._check_event_alerts
+        metrics_generated = [m for event in event_stream for m in extract(event, now)]
+        alerts_generated = [a for event in event_stream for a in check(event, now)]
+        if alerts_generated:
+            self._store_alerts(alerts_generated)
 
         return {
             "success": True,
             "events_processed": len(event_stream),
-            "metrics": [m.__dict__ for m in metrics_generated],
-            "alerts": [a.__dict__ for a in alerts_generated],
+            "events_dropped": dropped,
+            "metrics": metrics_generated,
+            "alerts": [a.to_dict() for a in alerts_generated],
         }
 
     async def _task_collect_metrics(
@@ -196,24 +417,32 @@ class ObservabilityAgent(Agent):
         metric_data = payload.get("metric_data", [])
 
         collected_metrics = []
+        now = time.time()
+        now_ms = int(now * 1000)
 
+        append = collected_metrics.append
         for data in metric_data:
-            metric = Metric(
-                metric_id=f"metric_{int(time.time() * 1000)}_{len(collected_metrics)}",
-                name=data.get("name", "unknown"),
-                value=float(data.get("value", 0)),
-                unit=data.get("unit", "count"),
-                timestamp=data.get("timestamp", time.time()),
-                tags=data.get("tags", {}),
-                metadata=data.get("metadata", {}),
+            get = data.get
+            append(
+                Metric(
+                    metric_id=f"metric_{now_ms}_{next(_ID_SEQ)}",
+                    name=get("name", "unknown"),
+                    value=float(get("value", 0)),
+                    unit=get("unit", "count"),
+                    timestamp=get("timestamp", now),
+                    tags=get("tags", {}),
+                    metadata=get("metadata", {}),
+                )
             )
-            collected_metrics.append(metric)
 
-            with self._lock:
-                self._metrics.append(metric)
+        # Store the whole batch under one lock acquisition
+        store = self._store_metric
+        with self._metrics_lock:
+            for metric in collected_metrics:
+                store(metric, now)
 
         # Aggregate metrics
-        aggregated = await self._aggregate_metrics(collected_metrics)
+        aggregated = self._aggregate_metrics(collected_metrics)
 
         return {
             "success": True,
@@ -226,26 +455,58 @@ class ObservabilityAgent(Agent):
         payload: dict[str, Any],
         context: dict[str, Any],
     ) -> dict[str, Any]:
-        """Task: Generate reports from data."""
+        """Task: Generate reports from data.
+
+        With background reports enabled the report is only queued; the
+        response carries its ID and callers poll ``get_report_status``.
+        """
         report_type = payload.get("report_type")
         data = payload.get("data", {})
 
         if not report_type:
             raise ValueError("report_type is required")
 
+        if report_type not in _REPORT_TYPES:
+            raise ValueError(f"Unknown report type: {report_type}")
+
+        report_id = f"report_{int(time.time())}_{next(_ID_SEQ)}_{self.agent_id}"
+
+        if self._report_queue is not None:
+            self._report_jobs[report_id] = "pending"
+            self._report_queue.put_nowait((report_id, report_type, data, dict(context)))
+            return {
+                "success": True,
+                "report_id": report_id,
+                "status": "pending",
+            }
+
+        report = self._build_report(report_id, report_type, data, context)
+        self._store_report(report)
+
+        return {
+            "success": True,
+            "report": report.to_dict(),
+        }
+
+    def _build_report(
+        self,
+        report_id: str,
+        report_type: str,
+        data: dict[str, Any],
+        context: dict[str, Any],
+    ) -> Report:
+        """Render a report of a known type."""
         if report_type == "summary":
-            content = await self._generate_summary_report(data, context)
+            content = self._generate_summary_report(data, context)
         elif report_type == "metrics":
-            content = await self._generate_metrics_report(data, context)
+            content = self._generate_metrics_report(data, context)
         elif report_type == "alerts":
-            content = await self._generate_alerts_report(data, context)
-        elif report_type == "execution":
-            content = await self._generate_execution_report(data, context)
+            content = self._generate_alerts_report(data, context)
         else:
-            raise ValueError(f"Unknown report type: {report_type}")
+            content = self._generate_execution_report(data, context)
 
-        report = Report(
-            report_id=f"report_{int(time.time())}_{self.agent_id}",
+        return Report(
+            report_id=report_id,
             report_type=report_type,
             title=f"{report_type.capitalize()} Report",
             content=content,
@@ -253,94 +514,144 @@ class ObservabilityAgent(Agent):
             format="markdown",
         )
 
-        with self._lock:
-            self._reports.append(report)
-
-        return {
-            "success": True,
-            "report": report.__dict__,
-        }
+    def _store_report(self, report: Report) -> None:
+        """Store a finished report, evicting the oldest past max_reports."""
+        with self._reports_lock:
+            self._reports[report.report_id] = report
+            if len(self._reports) > self._max_reports:
+                # Evict the oldest report (dicts keep insertion order)
+                del self._reports[next(iter(self._reports))]
+
+    async def _report_worker(self) -> None:
+        """Build queued reports in a worker thread, off the request path and the event loop."""
+        while True:
+            report_id, report_type, data, context = await self._report_queue.get()
+            try:
+                report = await asyncio.to_thread(
+                    self._build_report, report_id, report_type, data, context
+                )
+            except Exception:
+                logging.exception(f"Report {report_id} ({report_type}) failed")
+                self._report_jobs.pop(report_id, None)
+                failed = self._failed_reports
+                failed[report_id] = None
+                if len(failed) > self._max_reports:
+                    del failed[next(iter(failed))]
+            else:
+                self._store_report(report)
+                self._report_jobs.pop(report_id, None)
+            finally:
+                self._report_queue.task_done()
 
     async def _task_check_alerts(
         self,
         payload: dict[str, Any],
         context: dict[str, Any],
     ) -> dict[str, Any]:
-        """Task: Check metrics against alert thresholds."""
+        """Task: Check metrics against alert thresholds.
+
+        ``summary_only`` returns per-severity counts instead of the alerts;
+        ``include_alerts=False`` returns just the total.
+        """
         metrics = payload.get("metrics", [])
 
         alerts = []
+        now = time.time()
 
         for metric in metrics:
-            metric_alerts = await self._check_metric_alerts(metric)
+            metric_alerts = self._check_metric_alerts(metric, now)
             alerts.extend(metric_alerts)
 
+        if alerts:
+            self._store_alerts(alerts)
+
+        if payload.get("summary_only", False):
+            return {
+                "success": True,
+                "total_alerts": len(alerts),
+                "by_severity": dict(Counter(a.severity for a in alerts)),
+            }
+
+        if not payload.get("include_alerts", True):
+            return {
+                "success": True,
+                "total_alerts": len(alerts),
+            }
+
         return {
             "success": True,
-            "alerts": [a.__dict__ for a in alerts],
+            "alerts": [a.to_dict() for a in alerts],
             "total_alerts": len(alerts),
         }
 
-    async def _extract_metrics_from_event(
+    def _extract_metrics_from_event(
         self,
         event: dict[str, Any],
+        now: float,
     ) -> list[Metric]:
         """Extract metrics from an event."""
-        metrics = []
+        return [Metric(**data) for data in self._extract_metric_dicts_from_event(event, now)]
 
+    def _extract_metric_dicts_from_event(
+        self,
+        event: dict[str, Any],
+        now: float,
+    ) -> list[dict[str, Any]]:
+        """Extract metrics from an event as dicts shaped like ``Metric.to_dict()``."""
         # Common metrics to extract
         event_type = event.get("event_type", "unknown")
+        agent_id = event.get("agent_id", "")
+        timestamp = event.get("timestamp", now)
+        stamp = int(now)
 
         # Count events by type
-        metrics.append(
-            Metric(
-                metric_id=f"event_count_{event_type}_{int(time.time())}",
-                name="event_count",
-                value=1.0,
-                unit="count",
-                timestamp=event.get("timestamp", time.time()),
-                tags={
-                    "event_type": event_type,
-                    "agent_id": event.get("agent_id", ""),
-                },
-            )
-        )
+        metrics = [
+            {
+                "metric_id": f"event_count_{event_type}_{stamp}_{next(_ID_SEQ)}",
+                "name": "event_count",
+                "value": 1.0,
+                "unit": "count",
+                "timestamp": timestamp,
+                "tags": {"event_type": event_type, "agent_id": agent_id},
+                "metadata": {},
+            }
+        ]
 
         # Extract duration if available
         duration = event.get("duration")
         if duration is not None:
             metrics.append(
-                Metric(
-                    metric_id=f"event_duration_{event_type}_{int(time.time())}",
-                    name="event_duration",
-                    value=float(duration),
-                    unit="seconds",
-                    timestamp=event.get("timestamp", time.time()),
-                    tags={
-                        "event_type": event_type,
-                        "agent_id": event.get("agent_id", ""),
-                    },
-                )
+                {
+                    "metric_id": f"event_duration_{event_type}_{stamp}_{next(_ID_SEQ)}",
+                    "name": "event_duration",
+                    "value": float(duration),
+                    "unit": "seconds",
+                    "timestamp": timestamp,
+                    "tags": {"event_type": event_type, "agent_id": agent_id},
+                    "metadata": {},
+                }
             )
 
         return metrics
 
-    async def _check_event_alerts(
+    def _check_event_alerts(
         self,
         event: dict[str, Any],
+        now: float,
     ) -> list[Alert]:
         """Check event for alert conditions."""
         alerts = []
+        timestamp = event.get("timestamp", now)
 
         # Check for error events
         if event.get("status") == "error":
             alerts.append(
                 Alert(
-                    alert_id=f"alert_error_{int(time.time())}",
+                    alert_id=f"alert_error_{int(now)}_{next(_ID_SEQ)}",
                     severity="high",
                     title=f"Error in {event.get('event_type', 'unknown')}",
                     description=event.get("error_message", "Unknown error"),
-                    timestamp=event.get("timestamp", time.time()),
+                    timestamp=timestamp,
                 )
             )
 
@@ -349,21 +660,22 @@ class ObservabilityAgent(Agent):
         if duration and duration > 300:  # 5 minutes
             alerts.append(
                 Alert(
-                    alert_id=f"alert_long_duration_{int(time.time())}",
+                    alert_id=f"alert_long_duration_{int(now)}_{next(_ID_SEQ)}",
                     severity="warning",
                     title=f"Long running event: {event.get('event_type', 'unknown')}",
                     description=f"Event took {duration} seconds to complete",
                     current_value=duration,
                     threshold=300,
-                    timestamp=event.get("timestamp", time.time()),
+                    timestamp=timestamp,
                 )
             )
 
         return alerts
 
-    async def _check_metric_alerts(
+    def _check_metric_alerts(
         self,
         metric: dict[str, Any],
+        now: float,
     ) -> list[Alert]:
         """Check metric against alert rules."""
         alerts = []
@@ -371,76 +683,60 @@ class ObservabilityAgent(Agent):
         metric_name = metric.get("name")
         metric_value = metric.get("value", 0)
 
-        for rule_name, rule in self._alert_rules.items():
-            if rule.get("metric_name") == metric_name:
-                condition = rule.get("condition")
-                threshold = rule.get("threshold")
-                severity = rule.get("severity", "warning")
-
-                should_alert = False
-
-                if condition == "gt" and metric_value > threshold:
-                    should_alert = True
-                elif condition == "lt" and metric_value < threshold:
-                    should_alert = True
-                elif condition == "eq" and metric_value == threshold:
-                    should_alert = True
-                elif condition == "ne" and metric_value != threshold:
-                    should_alert = True
-
-                if should_alert:
-                    alerts.append(
-                        Alert(
-                            alert_id=f"alert_{rule_name}_{int(time.time())}",
-                            severity=severity,
-                            title=f"Alert: {rule_name}",
-                            description=rule.get("description", ""),
-                            metric_name=metric_name,
-                            threshold=threshold,
-                            current_value=metric_value,
-                            timestamp=time.time(),
-                        )
+        for rule_name, rule, compare in self._rules_by_metric.get(metric_name, ()):
+            threshold = rule.get("threshold")
+
+            if compare(metric_value, threshold):
+                alerts.append(
+                    Alert(
+                        alert_id=f"alert_{rule_name}_{int(now)}_{next(_ID_SEQ)}",
+                        severity=rule.get("severity", "warning"),
+                        title=f"Alert: {rule_name}",
+                        description=rule.get("description", ""),
+                        metric_name=metric_name,
+                        threshold=threshold,
+                        current_value=metric_value,
+                        timestamp=now,
                     )
+                )
 
         return alerts
 
-    async def _aggregate_metrics(
+    def _aggregate_metrics(
         self,
         metrics: list[Metric],
     ) -> dict[str, Any]:
         """Aggregate metrics by name."""
-        aggregated = {}
-
-        for metric in metrics:
-            name = metric.name
-
-            if name not in aggregated:
-                aggregated[name] = {
-                    "count": 0,
-                    "sum": 0.0,
-                    "min": float("inf"),
-                    "max": float("-inf"),
-                    "avg": 0.0,
-                }
-
-            aggregated[name]["count"] += 1
-            aggregated[name]["sum"] += metric.value
-            aggregated[name]["min"] = min(aggregated[name]["min"], metric.value)
-            aggregated[name]["max"] = max(aggregated[name]["max"], metric.value)
-            aggregated[name]["avg"] = aggregated[name]["sum"] / aggregated[name]["count"]
-
-        return aggregated
-
-    async def _generate_summary_report(
+        if np is not None and len(metrics) > _VECTORIZE_THRESHOLD:
+            return _aggregate_vectorized(metrics)
+
+        # Running [count, sum, min, max] per name; averages are taken once at the end
+        running: dict[str, list[float]] = {}
+
+        get_running = running.get
+        for name, value in map(_name_and_value, metrics):
+            stats = get_running(name)
+            if stats is None:
+                running[name] = [1, value, value, value]
+                continue
+            stats[0] += 1
+            stats[1] += value
+            if value < stats[2]:
+                stats[2] = value
+            if value > stats[3]:
+                stats[3] = value
+
+        return {name: _stats_summary(stats) for name, stats in running.items()}
+
+    def _generate_summary_report(
         self,
         data: dict[str, Any],
         context: dict[str, Any],
     ) -> str:
         """Generate a summary report."""
-        with self._lock:
-            total_metrics = len(self._metrics)
-            total_alerts = len(self._alerts)
-            total_reports = len(self._reports)
+        total_metrics = len(self._metrics)
+        total_alerts = len(self._alerts)
+        total_reports = len(self._reports)
 
         report = f"""# Summary Report
 
@@ -463,62 +759,70 @@ All systems operational.
 
         return report
 
-    async def _generate_metrics_report(
+    def _generate_metrics_report(
         self,
         data: dict[str, Any],
         context: dict[str, Any],
     ) -> str:
         """Generate a metrics report."""
-        with self._lock:
-            recent_metrics = self._metrics[-100:]  # Last 100 metrics
-
-        report = "# Metrics Report\n\n"
-        report += f"Generated at: {datetime.fromtimestamp(time.time()).isoformat()}\n\n"
+        # Recent values per metric name, maintained at ingestion
+        with self._metrics_lock:
+            aggregated = {name: _stats_summary(stats) for name, stats in self._window_stats.items()}
 
-        # Aggregate recent metrics
-        aggregated = await self._aggregate_metrics(recent_metrics)
+        parts = [
+            "# Metrics Report\n\n",
+            f"Generated at: {datetime.fromtimestamp(time.time()).isoformat()}\n\n",
+        ]
 
         for name, stats in aggregated.items():
-            report += f"## {name}\n"
-            report += f"- Count: {stats['count']}\n"
-            report += f"- Average: {stats['avg']:.2f}\n"
-            report += f"- Min: {stats['min']:.2f}\n"
-            report += f"- Max: {stats['max']:.2f}\n"
-            report += f"- Sum: {stats['sum']:.2f}\n\n"
+            parts.append(
+                f"## {name}\n"
+                f"- Count: {stats['count']}\n"
+                f"- Average: {stats['avg']:.2f}\n"
+                f"- Min: {stats['min']:.2f}\n"
+                f"- Max: {stats['max']:.2f}\n"
+                f"- Sum: {stats['sum']:.2f}\n\n"
+            )
 
-        return report
+        return "".join(parts)
 
-    async def _generate_alerts_report(
+    def _generate_alerts_report(
         self,
         data: dict[str, Any],
         context: dict[str, Any],
     ) -> str:
         """Generate an alerts report."""
-        with self._lock:
-            recent_alerts = self._alerts[-50:]  # Last 50 alerts
+        # Last 50 alerts of each severity, most severe first
+        with self._alerts_lock:
+            by_severity = self._alerts_by_severity
+            severities = [sev for sev in _SEVERITY_ORDER if sev in by_severity]
+            severities += sorted(sev for sev in by_severity if sev not in _SEVERITY_ORDER)
+            groups = [(sev, _recent(reversed(by_severity[sev]), 50)) for sev in severities]
+
+        parts = [
+            "# Alerts Report\n\n",
+            f"Generated at: {datetime.fromtimestamp(time.time()).isoformat()}\n\n",
+            f"Total Alerts: {sum(len(alerts) for _, alerts in groups)}\n\n",
+        ]
 
-        report = "# Alerts Report\n\n"
-        report += f"Generated at: {datetime.fromtimestamp(time.time()).isoformat()}\n\n"
-        report += f"Total Alerts: {len(recent_alerts)}\n\n"
-
-        # Group by severity
-        by_severity = {}
-        for alert in recent_alerts:
-            severity = alert.severity
-            if severity not in by_severity:
-                by_severity[severity] = []
-            by_severity[severity].append(alert)
-
-        for severity, alerts in sorted(by_severity.items()):
-            report += f"## {severity.upper()} ({len(alerts)})\n\n"
+        # Alerts from one batch share a timestamp; format each distinct one once
+        times: dict[float, str] = {}
+
+        for severity, alerts in groups:
+            parts.append(f"## {severity.upper()} ({len(alerts)})\n\n")
             for alert in alerts:
-                report += f"- **{alert.title}**\n"
-                report += f"  - {alert.description}\n"
-                report += f"  - Time: {datetime.fromtimestamp(alert.timestamp).isoformat()}\n\n"
+                formatted = times.get(alert.timestamp)
+                if formatted is None:
+                    formatted = times[alert.timestamp] = datetime.fromtimestamp(
+                        alert.timestamp
+                    ).isoformat()
+                parts.append(
+                    f"- **{alert.title}**\n  - {alert.description}\n  - Time: {formatted}\n\n"
+                )
 
-        return report
+        return "".join(parts)
 
-    async def _generate_execution_report(
+    def _generate_execution_report(
         self,
         data: dict[str, Any],
         context: dict[str, Any],
@@ -572,6 +876,19 @@ All systems operational.
             "description": "Low success rate detected",
         }
 
+        self._index_alert_rules()
+
+    def _index_alert_rules(self) -> None:
+        """Rebuild the metric_name -> rules index, resolving each condition."""
+        index: dict[str, list[tuple[str, dict[str, Any], Callable]]] = {}
+        for rule_name, rule in self._alert_rules.items():
+            compare = _CONDITIONS.get(rule.get("condition"))
+            if compare is None:
+                # Unknown conditions never fire
+                continue
+            index.setdefault(rule.get("metric_name"), []).append((rule_name, rule, compare))
+        self._rules_by_metric = index
+
     def _start_aggregation_timer(self) -> None:
         """Start background aggregation timer."""
         # In production, would use a proper scheduler
@@ -583,22 +900,110 @@ All systems operational.
 
     def add_metric(self, metric: Metric) -> None:
         """Add a metric."""
-        with self._lock:
-            self._metrics.append(metric)
+        with self._metrics_lock:
+            self._store_metric(metric, time.time())
+
+    def _store_metric(self, metric: Metric, now: float) -> None:
+        """Store a metric in history, aggregates and its time bucket."""
+        history = self._metrics
+        buckets = self._metric_buckets
+        if len(history) == history.maxlen and buckets:
+            self._evict_from_buckets(history[0])
+        history.append(metric)
+        self._update_aggregates(metric)
+
+        minute = int(now // _BUCKET_SECONDS)
+        if not buckets or buckets[-1][0] != minute:
+            buckets.append((minute, deque(), {}))
+        _, in_order, by_name = buckets[-1]
+        in_order.append(metric)
+        by_name.setdefault(metric.name, deque()).append(metric)
+
+    def _evict_from_buckets(self, metric: Metric) -> None:
+        """Drop the oldest metric in history from its bucket as history evicts it."""
+        # History and buckets are both in ingestion order, so the evicted
+        # metric is first in the oldest bucket, unless that bucket has
+        # already rotated out of the ring
+        buckets = self._metric_buckets
+        _, in_order, by_name = buckets[0]
+        if in_order[0] is not metric:
+            return
+        in_order.popleft()
+        same_name = by_name[metric.name]
+        same_name.popleft()
+        if not same_name:
+            del by_name[metric.name]
+        if not in_order:
+            buckets.popleft()
+
+    def _update_aggregates(self, metric: Metric) -> None:
+        """Fold a stored metric into the lifetime and windowed aggregates."""
+        name = metric.name
+        value = metric.value
+
+        stats = self._metric_aggregates.get(name)
+        if stats is None:
+            self._metric_aggregates[name] = [1, value, value, value]
+        else:
+            _accumulate(stats, value)
+
+        window = self._windows.get(name)
+        if window is None:
+            self._windows[name] = deque([value], maxlen=self._metrics_window)
+            self._window_stats[name] = [1, value, value, value]
+            return
+
+        stats = self._window_stats[name]
+        if len(window) == window.maxlen:
+            evicted = window[0]
+            window.append(value)
+            if evicted == stats[2] or evicted == stats[3]:
+                # The evicted sample may have been the extreme; rescan the window
+                stats[:] = [len(window), sum(window), min(window), max(window)]
+                return
+            stats[0] -= 1
+            stats[1] -= evicted
+        else:
+            window.append(value)
+        _accumulate(stats, value)
+
+    def get_metric_aggregates(self) -> dict[str, dict[str, float]]:
+        """Get count/sum/min/max/avg of every metric stored so far, by name."""
+        with self._metrics_lock:
+            return {name: _stats_summary(stats) for name, stats in self._metric_aggregates.items()}
 
     def get_metrics(
         self,
         name: str | None = None,
         limit: int = 100,
+        since: float | None = None,
     ) -> list[Metric]:
-        """Get metrics with optional filters."""
-        with self._lock:
-            metrics = self._metrics
-
+        """Get metrics with optional filters.
+
+        ``since`` restricts results to metrics ingested from that time on, to
+        minute granularity; only the matching time buckets are visited.
+        """
+        with self._metrics_lock:
+            if since is not None:
+                return _recent(self._iter_buckets(name, int(since // _BUCKET_SECONDS)), limit)
             if name:
-                metrics = [m for m in metrics if m.name == name]
-
-            return metrics[-limit:]
+                return _recent((m for m in reversed(self._metrics) if m.name == name), limit)
+            return _recent(reversed(self._metrics), limit)
+
+    def _iter_buckets(self, name: str | None, first_minute: int) -> Iterator[Metric]:
+        """Yield bucketed metrics newest first, stopping before first_minute."""
+        for minute, in_order, by_name in reversed(self._metric_buckets):
+            if minute < first_minute:
+                break
+            yield from reversed(by_name.get(name, ()) if name else in_order)
+
+    def _store_alerts(self, alerts: list[Alert]) -> None:
+        """Record generated alerts in history and per-severity buffers."""
+        with self._alerts_lock:
+            self._alerts.extend(alerts)
+            by_severity = self._alerts_by_severity
+            for alert in alerts:
+                by_severity[alert.severity].append(alert)
 
     def get_alerts(
         self,
@@ -606,13 +1011,10 @@ All systems operational.
         limit: int = 50,
     ) -> list[Alert]:
         """Get alerts with optional filters."""
-        with self._lock:
-            alerts = self._alerts
-
+        with self._alerts_lock:
             if severity:
-                alerts = [a for a in alerts if a.severity == severity]
-
-            return alerts[-limit:]
+                return _recent((a for a in reversed(self._alerts) if a.severity == severity), limit)
+            return _recent(reversed(self._alerts), limit)
 
     def add_alert_rule(
         self,
@@ -620,14 +1022,23 @@ All systems operational.
         rule: dict[str, Any],
     ) -> None:
         """Add an alert rule."""
-        self._alert_rules[rule_name] = rule
+        with self._rules_lock:
+            self._alert_rules = {**self._alert_rules, rule_name: rule}
+            self._index_alert_rules()
 
     def get_report(self, report_id: str) -> Report | None:
         """Get a report by ID."""
-        with self._lock:
-            return self._reports.get(report_id)
+        return self._reports.get(report_id)
+
+    def get_report_status(self, report_id: str) -> str | None:
+        """Get report status: pending, failed, completed, or None if unknown."""
+        status = self._report_jobs.get(report_id)
+        if status is not None:
+            return status
+        if report_id in self._failed_reports:
+            return "failed"
+        return "completed" if report_id in self._reports else None
 
     def list_reports(self) -> list[Report]:
         """List all reports."""
-        with self._lock:
-            return list(self._reports)
+        return list(self._reports.values())
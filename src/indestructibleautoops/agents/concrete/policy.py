@@ -6,16 +6,85 @@ This agent handles policy evaluation, compliance checking, and governance gates.
 
 from __future__ import annotations
 
+import itertools
 import threading
 import time
-from dataclasses import dataclass, field
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
 from typing import Any
 
 from ..base import Agent, AgentCapability
-from ..policy_engine import Policy, PolicyEngine, PolicySeverity, PolicyType
+from ..policy_engine import (
+    Policy,
+    PolicyEngine,
+    PolicyEvaluator,
+    PolicySeverity,
+    PolicyType,
+    PolicyViolation,
+)
+
+# Enum members by value; misses fall back to the Enum constructor for its error
+_POLICY_TYPE_BY_VALUE = {e.value: e for e in PolicyType}
+_POLICY_SEVERITY_BY_VALUE = {e.value: e for e in PolicySeverity}
+
+
+def _policy_type(value: str) -> PolicyType:
+    """Look up a policy type by value."""
+    return _POLICY_TYPE_BY_VALUE.get(value) or PolicyType(value)
+
+
+def _policy_severity(value: str) -> PolicySeverity:
+    """Look up a policy severity by value."""
+    return _POLICY_SEVERITY_BY_VALUE.get(value) or PolicySeverity(value)
+
+
+# Compliance checks per standard as (check name, context flag, description)
+_STANDARDS_SPEC: dict[str, tuple[tuple[str, str, str], ...]] = {
+    "SOC2": (
+        ("audit_logging", "audit_logging_enabled", "Audit logging must be enabled"),
+        ("access_controls", "access_controls_enabled", "Access controls must be implemented"),
+    ),
+    "GDPR": (
+        ("data_minimization", "data_minimization", "Data minimization must be implemented"),
+        ("consent_management", "consent_management", "Consent management must be implemented"),
+    ),
+    "HIPAA": (
+        ("encryption_at_rest", "encryption_at_rest", "Encryption at rest must be enabled"),
+        ("audit_trails", "audit_trails", "Audit trails must be maintained"),
+    ),
+}
+
+
+def _prebuild_results(
+    standard: str, spec: tuple[tuple[str, str, str], ...]
+) -> dict[tuple[bool, ...], Mapping[str, Any]]:
+    """Build a standard's result for every combination of check outcomes."""
+    return {
+        flags: MappingProxyType(
+            {
+                "compliant": all(flags),
+                "standard": standard,
+                "checks": tuple(
+                    MappingProxyType({"check": name, "passed": passed, "description": description})
+                    for (name, _, description), passed in zip(spec, flags, strict=True)
+                ),
+            }
+        )
+        for flags in itertools.product((False, True), repeat=len(spec))
+    }
+
 
+# Prebuilt results per standard: (context flags, {flag values: result}). Results
+# are shared, so they are read-only views; ComplianceResult copies them into
+# fresh dicts for responses.
+_STANDARD_RESULTS: dict[str, tuple[tuple[str, ...], dict[tuple[bool, ...], Mapping[str, Any]]]] = {
+    standard: (tuple(key for _, key, _ in spec), _prebuild_results(standard, spec))
+    for standard, spec in _STANDARDS_SPEC.items()
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class PolicySet:
     """A set of policies for evaluation."""
 
@@ -25,7 +94,7 @@ class PolicySet:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GovernanceGate:
     """A governance gate that must be passed."""
 
@@ -36,6 +105,104 @@ class GovernanceGate:
     approval_required: bool = False
     approvers: list[str] = field(default_factory=list)
     status: str = "pending"
+    # Approver lookup set, built once from approvers at creation
+    approvers_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.approvers_set = frozenset(self.approvers)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert gate to dictionary."""
+        return {
+            "gate_id": self.gate_id,
+            "name": self.name,
+            "description": self.description,
+            "required_policies": list(self.required_policies),
+            "approval_required": self.approval_required,
+            "approvers": list(self.approvers),
+            "status": self.status,
+        }
+
+
+@dataclass(slots=True)
+class EvaluateResult:
+    """Result of evaluating policies against a context."""
+
+    set_id: str
+    passed: bool
+    violations: list[PolicyViolation]
+    include_violations: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to dictionary, with a violation count when violations are omitted."""
+        result = {
+            "success": self.passed,
+            "set_id": self.set_id,
+            "passed": self.passed,
+        }
+        if self.include_violations:
+            result["violations"] = [v.to_dict() for v in self.violations]
+        else:
+            result["violations_count"] = len(self.violations)
+        return result
+
+
+@dataclass(slots=True)
+class ComplianceResult:
+    """Result of checking compliance with a set of standards."""
+
+    all_compliant: bool
+    compliance_results: dict[str, Mapping[str, Any]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to dictionary, copying the shared check records."""
+        return {
+            "success": self.all_compliant,
+            "all_compliant": self.all_compliant,
+            "compliance_results": {
+                standard: {**result, "checks": [dict(check) for check in result["checks"]]}
+                for standard, result in self.compliance_results.items()
+            },
+        }
+
+
+@dataclass(slots=True)
+class GatesResult:
+    """Result of creating governance gates."""
+
+    gates: list[GovernanceGate]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to dictionary."""
+        return {
+            "success": True,
+            "gates": [gate.to_dict() for gate in self.gates],
+        }
+
+
+@dataclass(slots=True)
+class ApprovalResult:
+    """Result of an approval request: auto-approved or pending."""
+
+    approved: bool
+    gate_id: str
+    approval_id: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to dictionary."""
+        if self.approval_id is None:
+            return {
+                "success": True,
+                "approved": self.approved,
+                "gate_id": self.gate_id,
+                "auto_approved": True,
+            }
+        return {
+            "success": True,
+            "approved": self.approved,
+            "approval_id": self.approval_id,
+            "status": "pending",
+        }
 
 
 class PolicyAgent(Agent):
@@ -80,10 +247,34 @@ class PolicyAgent(Agent):
         self._policy_sets: dict[str, PolicySet] = {}
         self._gates: dict[str, GovernanceGate] = {}
         self._approvals: dict[str, dict[str, Any]] = {}
-        self._lock = threading.RLock()
+        # Guards writes to gates and policy sets. Gate reads are single dict
+        # operations, atomic under the CPython GIL, and take no lock.
+        self._lock = threading.Lock()
+
+        # Policies indexed by the top-level context keys their conditions read.
+        # Policies whose outcome does not depend only on those keys being
+        # present (rule patterns, or conditions that fail on missing keys) are
+        # evaluated for every context. Order keeps violations in add order.
+        self._policy_index_by_key: dict[str, set[str]] = {}
+        self._always_evaluated: set[str] = set()
+        self._policy_order: dict[str, int] = {}
+        self._policy_seq = itertools.count()
+
+        # Policy set and approval IDs: startup timestamp plus a counter
+        self._start_ns = time.time_ns()
+        self._id_counter = itertools.count()
+
+        # Task dispatch table
+        self._task_handlers = {
+            "evaluate_policies": self._task_evaluate_policies,
+            "check_compliance": self._task_check_compliance,
+            "create_gates": self._task_create_gates,
+            "request_approval": self._task_request_approval,
+        }
 
-        # Load default policies
-        self._load_default_policies()
+        # Default policies are loaded on first use of the policy engine
+        self._defaults_loaded = False
+        self._defaults_lock = threading.Lock()
 
     async def initialize(self) -> None:
         """Initialize the policy agent."""
@@ -104,35 +295,29 @@ class PolicyAgent(Agent):
         task: dict[str, Any],
         context: dict[str, Any],
     ) -> dict[str, Any]:
-        """Execute a task assigned to this agent."""
+        """Execute a task assigned to this agent.
+
+        Errors propagate to the caller; task assignment reports them as TASK_FAIL.
+        Handlers return typed results, serialized here as the task leaves the agent.
+        """
         task_type = task.get("task_type", "")
-        payload = task.get("payload", {})
-
-        try:
-            if task_type == "evaluate_policies":
-                return await self._task_evaluate_policies(payload, context)
-            elif task_type == "check_compliance":
-                return await self._task_check_compliance(payload, context)
-            elif task_type == "create_gates":
-                return await self._task_create_gates(payload, context)
-            elif task_type == "request_approval":
-                return await self._task_request_approval(payload, context)
-            else:
-                raise ValueError(f"Unknown task type: {task_type}")
-
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "task_type": task_type,
-            }
+        handler = self._task_handlers.get(task_type)
+        if handler is None:
+            raise ValueError(f"Unknown task type: {task_type}")
+        result = await handler(task.get("payload", {}), context)
+        return result.to_dict()
 
     async def _task_evaluate_policies(
         self,
         payload: dict[str, Any],
         context: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Task: Evaluate policies against context."""
+    ) -> EvaluateResult:
+        """Task: Evaluate policies against context.
+
+        ``include_violations=False`` returns a violation count instead of the
+        violations; they stay queryable from the policy engine.
+        """
+        self._ensure_defaults_loaded()
         policies_config = payload.get("policies_config", {})
         eval_context = payload.get("context", {})
         agent_id = payload.get("agent_id", "")
@@ -144,26 +329,27 @@ class PolicyAgent(Agent):
         else:
             set_id = payload.get("set_id", "default")
 
-        # Evaluate policies
+        # Evaluate only the policies that can be affected by this context
         passed, violations = self._policy_engine.evaluate_action(
             agent_id=agent_id,
             action="execute",
             context=eval_context,
             block_on_critical=True,
+            candidate_policy_ids=self._candidate_policy_ids(eval_context),
         )
 
-        return {
-            "success": passed,
-            "set_id": set_id,
-            "passed": passed,
-            "violations": [v.to_dict() for v in violations],
-        }
+        return EvaluateResult(
+            set_id=set_id,
+            passed=passed,
+            violations=violations,
+            include_violations=payload.get("include_violations", True),
+        )
 
     async def _task_check_compliance(
         self,
         payload: dict[str, Any],
         context: dict[str, Any],
-    ) -> dict[str, Any]:
+    ) -> ComplianceResult:
         """Task: Check compliance with standards."""
         eval_context = payload.get("context", {})
         standards = payload.get("standards", [])
@@ -171,30 +357,39 @@ class PolicyAgent(Agent):
         if not standards:
             raise ValueError("standards are required")
 
-        compliance_results = {}
-        all_compliant = True
-
+        # Standard checks are table lookups and never await, so a loop is enough.
+        # With fast_fail_compliance, standards after the first non-compliant
+        # one are skipped but keep the same result shape.
+        fast_fail = self.config.get("fast_fail_compliance", False)
+        compliance_results: dict[str, Mapping[str, Any]] = {}
+        failed = False
         for standard in standards:
-            result = await self._check_standard_compliance(
-                standard,
-                eval_context,
-                context,
-            )
+            if failed:
+                compliance_results[standard] = {
+                    "compliant": False,
+                    "standard": standard,
+                    "checks": [],
+                    "skipped": True,
+                }
+                continue
+            result = self._check_standard_compliance(standard, eval_context)
             compliance_results[standard] = result
-            if not result.get("compliant", False):
-                all_compliant = False
+            failed = fast_fail and not result["compliant"]
 
-        return {
-            "success": all_compliant,
-            "all_compliant": all_compliant,
-            "compliance_results": compliance_results,
-        }
+        all_compliant = all(
+            result.get("compliant", False) for result in compliance_results.values()
+        )
+
+        return ComplianceResult(
+            all_compliant=all_compliant,
+            compliance_results=compliance_results,
+        )
 
     async def _task_create_gates(
         self,
         payload: dict[str, Any],
         context: dict[str, Any],
-    ) -> dict[str, Any]:
+    ) -> GatesResult:
         """Task: Create governance gates."""
         gate_definitions = payload.get("gates", [])
 
@@ -213,18 +408,15 @@ class PolicyAgent(Agent):
             )
 
             self._gates[gate.gate_id] = gate
-            created_gates.append(gate.__dict__)
+            created_gates.append(gate)
 
-        return {
-            "success": True,
-            "gates": created_gates,
-        }
+        return GatesResult(gates=created_gates)
 
     async def _task_request_approval(
         self,
         payload: dict[str, Any],
         context: dict[str, Any],
-    ) -> dict[str, Any]:
+    ) -> ApprovalResult:
         """Task: Request approval for actions."""
         gate_id = payload.get("gate_id")
         request = payload.get("request", {})
@@ -240,15 +432,10 @@ class PolicyAgent(Agent):
         if not gate.approval_required:
             # Auto-approve if no approval required
             gate.status = "approved"
-            return {
-                "success": True,
-                "approved": True,
-                "gate_id": gate_id,
-                "auto_approved": True,
-            }
+            return ApprovalResult(approved=True, gate_id=gate_id)
 
         # Create approval request
-        approval_id = f"approval_{int(time.time())}_{self.agent_id}"
+        approval_id = self._next_id("approval")
         approval = {
             "approval_id": approval_id,
             "gate_id": gate_id,
@@ -266,23 +453,74 @@ class PolicyAgent(Agent):
         # - Track approval status
 
         # For now, simulate pending approval
-        return {
-            "success": True,
-            "approved": False,
-            "approval_id": approval_id,
-            "status": "pending",
-        }
+        return ApprovalResult(approved=False, gate_id=gate_id, approval_id=approval_id)
 
     def add_policy(self, policy: Policy) -> None:
         """Add a policy to the engine."""
-        self._policy_engine.add_policy(policy)
+        self.add_policies([policy])
+
+    def add_policies(self, policies: list[Policy]) -> None:
+        """Add several policies to the engine in one pass."""
+        self._ensure_defaults_loaded()
+        self._policy_engine.add_policies(policies)
+        self._index_policies(policies)
 
     def remove_policy(self, policy_id: str) -> bool:
         """Remove a policy from the engine."""
+        self._ensure_defaults_loaded()
+        with self._lock:
+            self._unindex_policy(policy_id)
         return self._policy_engine.remove_policy(policy_id)
 
+    def _index_policies(self, policies: list[Policy]) -> None:
+        """Index policies by the context keys their conditions read."""
+        entries = []
+        for policy in policies:
+            keys = {key.split(".", 1)[0] for key in policy.conditions}
+            # With none of its keys present, a policy sees only missing values
+            try:
+                passes_without_keys = PolicyEvaluator(
+                    replace(policy, enabled=True, rule_pattern="")
+                ).evaluate({})
+            except Exception:
+                passes_without_keys = False
+            always = bool(policy.rule_pattern) or not passes_without_keys
+            entries.append((policy.policy_id, keys, always))
+
+        with self._lock:
+            index = self._policy_index_by_key
+            for policy_id, keys, always in entries:
+                self._unindex_policy(policy_id)
+                self._policy_order[policy_id] = next(self._policy_seq)
+                for key in keys:
+                    index.setdefault(key, set()).add(policy_id)
+                if always:
+                    self._always_evaluated.add(policy_id)
+
+    def _unindex_policy(self, policy_id: str) -> None:
+        """Drop a policy from the key index. Caller holds the lock."""
+        if self._policy_order.pop(policy_id, None) is None:
+            return
+        self._always_evaluated.discard(policy_id)
+        for key, policy_ids in list(self._policy_index_by_key.items()):
+            policy_ids.discard(policy_id)
+            if not policy_ids:
+                del self._policy_index_by_key[key]
+
+    def _candidate_policy_ids(self, eval_context: dict[str, Any]) -> list[str]:
+        """Return the IDs of policies that need evaluating for a context, in add order."""
+        with self._lock:
+            candidates = set(self._always_evaluated)
+            index = self._policy_index_by_key
+            for key in eval_context:
+                policy_ids = index.get(key)
+                if policy_ids:
+                    candidates.update(policy_ids)
+            return sorted(candidates, key=self._policy_order.__getitem__)
+
     def get_policy(self, policy_id: str) -> Policy | None:
         """Get a policy by ID."""
+        self._ensure_defaults_loaded()
         return self._policy_engine.get_policy(policy_id)
 
     def list_policies(
@@ -291,17 +529,20 @@ class PolicyAgent(Agent):
         enabled_only: bool = False,
     ) -> list[Policy]:
         """List policies."""
+        self._ensure_defaults_loaded()
         return self._policy_engine.list_policies(policy_type, enabled_only)
 
     def get_gate(self, gate_id: str) -> GovernanceGate | None:
         """Get a gate by ID."""
-        with self._lock:
-            return self._gates.get(gate_id)
+        return self._gates.get(gate_id)
 
     def list_gates(self) -> list[GovernanceGate]:
         """List all gates."""
-        with self._lock:
-            return list(self._gates.values())
+        return list(self._gates.values())
+
+    def iter_gates(self) -> Iterator[GovernanceGate]:
+        """Iterate over a snapshot of all gates, taken at call time, without building a list."""
+        return iter(tuple(self._gates.values()))
 
     def approve_gate(self, gate_id: str, approver: str) -> bool:
         """Approve a gate."""
@@ -310,7 +551,7 @@ class PolicyAgent(Agent):
             if not gate:
                 return False
 
-            if approver not in gate.approvers:
+            if approver not in gate.approvers_set:
                 return False
 
             gate.status = "approved"
@@ -323,7 +564,7 @@ class PolicyAgent(Agent):
             if not gate:
                 return False
 
-            if approver not in gate.approvers:
+            if approver not in gate.approvers_set:
                 return False
 
             gate.status = "rejected"
@@ -334,23 +575,23 @@ class PolicyAgent(Agent):
         policies_config: dict[str, Any],
     ) -> PolicySet:
         """Create a policy set from configuration."""
-        policies = []
-
-        for policy_config in policies_config.get("policies", []):
-            policy = Policy(
+        # Build every policy first, then register them with one engine lock acquisition
+        policies = [
+            Policy(
                 name=policy_config.get("name", ""),
                 description=policy_config.get("description", ""),
-                policy_type=PolicyType(policy_config.get("type", "security")),
-                severity=PolicySeverity(policy_config.get("severity", "warning")),
+                policy_type=_policy_type(policy_config.get("type", "security")),
+                severity=_policy_severity(policy_config.get("severity", "warning")),
                 enabled=policy_config.get("enabled", True),
                 conditions=policy_config.get("conditions", {}),
                 actions=policy_config.get("actions", []),
             )
-            policies.append(policy)
-            self._policy_engine.add_policy(policy)
+            for policy_config in policies_config.get("policies", [])
+        ]
+        self.add_policies(policies)
 
         policy_set = PolicySet(
-            set_id=f"set_{int(time.time())}_{self.agent_id}",
+            set_id=self._next_id("set"),
             policies=policies,
             version=policies_config.get("version", "1.0.0"),
             metadata=policies_config.get("metadata", {}),
@@ -361,148 +602,39 @@ class PolicyAgent(Agent):
 
         return policy_set
 
-    async def _check_standard_compliance(
+    def _check_standard_compliance(
         self,
         standard: str,
         eval_context: dict[str, Any],
-        context: dict[str, Any],
-    ) -> dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Check compliance with a specific standard."""
-        # Standard-specific compliance checks
-        if standard == "SOC2":
-            return await self._check_soc2_compliance(eval_context, context)
-        elif standard == "GDPR":
-            return await self._check_gdpr_compliance(eval_context, context)
-        elif standard == "HIPAA":
-            return await self._check_hipaa_compliance(eval_context, context)
-        else:
+        prebuilt = _STANDARD_RESULTS.get(standard)
+        if prebuilt is None:
             return {
                 "compliant": True,
                 "standard": standard,
                 "checks": [],
             }
-
-    async def _check_soc2_compliance(
-        self,
-        eval_context: dict[str, Any],
-        context: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Check SOC2 compliance."""
-        checks = []
-        all_passed = True
-
-        # Check for audit logging
-        has_audit_logs = eval_context.get("audit_logging_enabled", False)
-        checks.append(
-            {
-                "check": "audit_logging",
-                "passed": has_audit_logs,
-                "description": "Audit logging must be enabled",
-            }
-        )
-        if not has_audit_logs:
-            all_passed = False
-
-        # Check for access controls
-        has_access_controls = eval_context.get("access_controls_enabled", False)
-        checks.append(
-            {
-                "check": "access_controls",
-                "passed": has_access_controls,
-                "description": "Access controls must be implemented",
-            }
-        )
-        if not has_access_controls:
-            all_passed = False
-
-        return {
-            "compliant": all_passed,
-            "standard": "SOC2",
-            "checks": checks,
-        }
-
-    async def _check_gdpr_compliance(
-        self,
-        eval_context: dict[str, Any],
-        context: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Check GDPR compliance."""
-        checks = []
-        all_passed = True
-
-        # Check for data minimization
-        has_data_minimization = eval_context.get("data_minimization", False)
-        checks.append(
-            {
-                "check": "data_minimization",
-                "passed": has_data_minimization,
-                "description": "Data minimization must be implemented",
-            }
-        )
-        if not has_data_minimization:
-            all_passed = False
-
-        # Check for consent management
-        has_consent = eval_context.get("consent_management", False)
-        checks.append(
-            {
-                "check": "consent_management",
-                "passed": has_consent,
-                "description": "Consent management must be implemented",
-            }
-        )
-        if not has_consent:
-            all_passed = False
-
-        return {
-            "compliant": all_passed,
-            "standard": "GDPR",
-            "checks": checks,
-        }
-
-    async def _check_hipaa_compliance(
-        self,
-        eval_context: dict[str, Any],
-        context: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Check HIPAA compliance."""
-        checks = []
-        all_passed = True
-
-        # Check for encryption at rest
-        has_encryption = eval_context.get("encryption_at_rest", False)
-        checks.append(
-            {
-                "check": "encryption_at_rest",
-                "passed": has_encryption,
-                "description": "Encryption at rest must be enabled",
-            }
-        )
-        if not has_encryption:
-            all_passed = False
-
-        # Check for audit trails
-        has_audit_trails = eval_context.get("audit_trails", False)
-        checks.append(
-            {
-                "check": "audit_trails",
-                "passed": has_audit_trails,
-                "description": "Audit trails must be maintained",
-            }
-        )
-        if not has_audit_trails:
-            all_passed = False
-
-        return {
-            "compliant": all_passed,
-            "standard": "HIPAA",
-            "checks": checks,
-        }
+        keys, results = prebuilt
+        return results[tuple(bool(eval_context.get(key, False)) for key in keys)]
+
+    def _next_id(self, prefix: str) -> str:
+        """Mint a collision-free ID for a policy set or approval."""
+        return f"{prefix}_{self._start_ns}_{next(self._id_counter)}_{self.agent_id}"
+
+    def _ensure_defaults_loaded(self) -> None:
+        """Load the default policies once, before anything else touches the engine."""
+        if self._defaults_loaded:
+            return
+        with self._defaults_lock:
+            if not self._defaults_loaded:
+                self._load_default_policies()
+                self._defaults_loaded = True
 
     def _load_default_policies(self) -> None:
         """Load default security policies."""
-        # Security policies
-        self.add_policy(
+        default_policies = [
+            # Security policies
             Policy(
                 name="no_secrets_in_code",
                 description="Prevent secrets in code files",
@@ -512,10 +644,7 @@ class PolicyAgent(Agent):
                     "file_extension": {"not_in": [".env", ".secret", ".key"]},
                 },
                 actions=["block", "log"],
-            )
-        )
-
-        self.add_policy(
+            ),
             Policy(
                 name="require_readme",
                 description="Require README.md in project",
@@ -525,11 +654,8 @@ class PolicyAgent(Agent):
                     "has_readme": {"eq": True},
                 },
                 actions=["log"],
-            )
-        )
-
-        # Governance policies
-        self.add_policy(
+            ),
+            # Governance policies
             Policy(
                 name="require_approval_for_destructive",
                 description="Require approval for destructive operations",
@@ -539,8 +665,10 @@ class PolicyAgent(Agent):
                     "operation_type": {"in": ["delete", "truncate", "drop"]},
                 },
                 actions=["block", "alert"],
-            )
-        )
+            ),
+        ]
+        self._policy_engine.add_policies(default_policies)
+        self._index_policies(default_policies)
 
     async def _load_policies_from_config(
         self,
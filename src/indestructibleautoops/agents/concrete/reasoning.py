@@ -6,13 +6,114 @@ This agent handles repair planning, risk assessment, and DAG analysis.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import tempfile
 import threading
 import time
+from array import array
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from itertools import accumulate, chain, count
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
 
 from ..base import Agent, AgentCapability
 
+# Extensions of files likely to hold secrets
+_SENSITIVE_EXTS = (".env", ".secret", ".key", ".pem")
+
+# Files every project is expected to have, in reporting order
+_ESSENTIAL_FILES = ("README.md", "LICENSE")
+_ESSENTIAL_FILE_SET = frozenset(_ESSENTIAL_FILES)
+
+# Fix-step priorities, most urgent first
+_STEP_PRIORITY = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Dependency manifests, in reporting order
+_DEPENDENCY_FILES = ("requirements.txt", "package.json", "go.mod", "Cargo.toml")
+_DEPENDENCY_FILE_SET = frozenset(_DEPENDENCY_FILES)
+
+# Plan store under state_dir
+_PLANS_FILE = "plans.json"
+
+
+def _is_sensitive_path(path_lower: str) -> bool:
+    """Check a lowercased path for a secrets extension or a .env variant like .env.local."""
+    return path_lower.endswith(_SENSITIVE_EXTS) or path_lower.rpartition("/")[2].startswith(".env.")
+
+
+def _index_graph(
+    nodes: list[str],
+    edges: list[tuple[str, str]],
+) -> tuple[list[str], array, array]:
+    """Map nodes to dense integer IDs and store successors in CSR form.
+
+    Successors of node u are indices[indptr[u]:indptr[u + 1]], in edge order.
+    Duplicate nodes get one ID and edges touching unknown nodes are dropped.
+    """
+    ids: dict[str, int] = {}
+    for node in nodes:
+        ids.setdefault(node, len(ids))
+
+    # Collect successor lists, then flatten them into the two CSR arrays
+    successors: list[list[int]] = [[] for _ in ids]
+    get_id = ids.get
+    for src, dst in edges:
+        u = get_id(src)
+        v = get_id(dst)
+        if u is not None and v is not None:
+            successors[u].append(v)
+
+    indptr = array("i", accumulate(map(len, successors), initial=0))
+    indices = array("i", chain.from_iterable(successors))
+
+    return list(ids), indptr, indices
+
+
+def _topological_order(indptr: array, indices: array) -> list[int]:
+    """Kahn's algorithm over a CSR graph; nodes on or behind cycles are left out."""
+    in_degree = [0] * (len(indptr) - 1)
+    for v in indices:
+        in_degree[v] += 1
+
+    # The order doubles as the FIFO queue: start from nodes with no dependencies
+    # and append each node as its last dependency is emitted
+    order = [u for u, degree in enumerate(in_degree) if degree == 0]
+
+    for u in order:
+        for v in indices[indptr[u] : indptr[u + 1]]:
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                order.append(v)
+
+    return order
+
+
+def _level_groups(
+    names: list[str],
+    indptr: array,
+    indices: array,
+    order: list[int],
+) -> list[list[str]]:
+    """Group ordered nodes by level: one more than their deepest dependency."""
+    # Push levels forward in topological order
+    level = [0] * len(names)
+    for u in order:
+        next_level = level[u] + 1
+        for v in indices[indptr[u] : indptr[u + 1]]:
+            if level[v] < next_level:
+                level[v] = next_level
+
+    groups: list[list[str]] = [[] for _ in range(max((level[u] for u in order), default=-1) + 1)]
+    for u in order:
+        groups[level[u]].append(names[u])
+
+    return groups
+
 
 @dataclass
 class RepairPlan:
@@ -25,6 +126,17 @@ class RepairPlan:
     estimated_duration: float
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert plan to a shallow dictionary."""
+        return {
+            "plan_id": self.plan_id,
+            "issues_found": self.issues_found,
+            "steps": self.steps,
+            "risk_assessment": self.risk_assessment,
+            "estimated_duration": self.estimated_duration,
+            "metadata": self.metadata,
+        }
+
 
 @dataclass
 class RiskFindings:
@@ -35,6 +147,15 @@ class RiskFindings:
     risks: list[dict[str, Any]]
     recommendations: list[str]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert findings to a shallow dictionary."""
+        return {
+            "total_risks": self.total_risks,
+            "by_severity": self.by_severity,
+            "risks": self.risks,
+            "recommendations": self.recommendations,
+        }
+
 
 class ReasoningAgent(Agent):
     """Agent for reasoning and planning operations."""
@@ -76,21 +197,33 @@ class ReasoningAgent(Agent):
         # Internal state
         self._repair_plans: dict[str, RepairPlan] = {}
         self._risk_assessments: dict[str, RiskFindings] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+
+        # Plan IDs: startup timestamp plus a counter
+        self._start_ns = time.time_ns()
+        self._plan_seq = count()
+
+        # Task dispatch table
+        self._task_handlers = {
+            "create_repair_plan": self._task_create_repair_plan,
+            "analyze_risks": self._task_analyze_risks,
+            "validate_dag": self._task_validate_dag,
+            "optimize_execution": self._task_optimize_execution,
+        }
 
     async def initialize(self) -> None:
         """Initialize the reasoning agent."""
         # Load previous plans if configured
         state_dir = self.config.get("state_dir")
         if state_dir:
-            await self._load_plans(state_dir)
+            await asyncio.to_thread(self._load_plans, state_dir)
 
     async def shutdown(self) -> None:
         """Shutdown the reasoning agent."""
         # Save plans if configured
         state_dir = self.config.get("state_dir")
         if state_dir:
-            await self._save_plans(state_dir)
+            await asyncio.to_thread(self._save_plans, state_dir)
 
     async def execute_task(
         self,
@@ -102,16 +235,10 @@ class ReasoningAgent(Agent):
         payload = task.get("payload", {})
 
         try:
-            if task_type == "create_repair_plan":
-                return await self._task_create_repair_plan(payload, context)
-            elif task_type == "analyze_risks":
-                return await self._task_analyze_risks(payload, context)
-            elif task_type == "validate_dag":
-                return await self._task_validate_dag(payload, context)
-            elif task_type == "optimize_execution":
-                return await self._task_optimize_execution(payload, context)
-            else:
+            handler = self._task_handlers.get(task_type)
+            if handler is None:
                 raise ValueError(f"Unknown task type: {task_type}")
+            return await handler(payload, context)
 
         except Exception as e:
             return {
@@ -133,17 +260,17 @@ class ReasoningAgent(Agent):
             raise ValueError("project_snapshot is required")
 
         # Analyze issues
-        issues = await self._analyze_issues(project_snapshot, policy_set)
+        issues = self._analyze_issues(project_snapshot, policy_set)
 
         # Create steps to fix issues
-        steps = await self._create_fix_steps(issues, context)
+        steps = self._create_fix_steps(issues, context)
 
         # Assess risks
-        risk_assessment = await self._assess_plan_risks(steps, context)
+        risk_assessment = self._assess_plan_risks(steps, context)
 
         # Create plan
         plan = RepairPlan(
-            plan_id=f"plan_{int(time.time())}_{self.agent_id}",
+            plan_id=self._next_plan_id(),
             issues_found=issues,
             steps=steps,
             risk_assessment=risk_assessment,
@@ -159,7 +286,7 @@ class ReasoningAgent(Agent):
 
         return {
             "success": True,
-            "repair_plan": plan.__dict__,
+            "repair_plan": plan.to_dict(),
         }
 
     async def _task_analyze_risks(
@@ -173,28 +300,16 @@ class ReasoningAgent(Agent):
         if not project_snapshot:
             raise ValueError("project_snapshot is required")
 
-        # Analyze various risk categories
-        risks = []
-        recommendations = []
-
-        # File structure risks
+        # Analyze structure, content and dependency risks in one scan
         file_index = project_snapshot.get("file_index", {})
-        risks.extend(await self._analyze_file_structure_risks(file_index))
-
-        # Content risks
-        risks.extend(await self._analyze_content_risks(file_index, context))
-
-        # Dependency risks
-        risks.extend(await self._analyze_dependency_risks(file_index, context))
+        risks = list(self._scan_file_index(file_index, context))
 
         # Categorize by severity
         by_severity = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        for risk in risks:
-            severity = risk.get("severity", "low")
-            by_severity[severity] = by_severity.get(severity, 0) + 1
+        by_severity.update(Counter(risk.get("severity", "low") for risk in risks))
 
         # Generate recommendations
-        recommendations = await self._generate_recommendations(risks, context)
+        recommendations = self._generate_recommendations(risks, context)
 
         findings = RiskFindings(
             total_risks=len(risks),
@@ -205,7 +320,7 @@ class ReasoningAgent(Agent):
 
         return {
             "success": True,
-            "risk_findings": findings.__dict__,
+            "risk_findings": findings.to_dict(),
         }
 
     async def _task_validate_dag(
@@ -222,31 +337,36 @@ class ReasoningAgent(Agent):
         nodes = dag_definition.get("nodes", [])
         edges = dag_definition.get("edges", [])
 
+        # A cycle already makes the DAG invalid; skip the orphan and edge scans
+        if self._detect_cycle(nodes, edges):
+            return {
+                "success": False,
+                "valid": False,
+                "errors": ["DAG contains cycles"],
+                "warnings": [],
+            }
+
         errors = []
         warnings = []
 
-        # Check for cycles
-        has_cycle = await self._detect_cycle(nodes, edges)
-        if has_cycle:
-            errors.append("DAG contains cycles")
+        nodes_set = set(nodes)
 
-        # Check for orphan nodes
+        # Collect referenced nodes and check for missing dependencies in one pass
         referenced_nodes = set()
         for edge in edges:
-            referenced_nodes.add(edge[0])
-            referenced_nodes.add(edge[1])
+            src, dst = edge[0], edge[1]
+            referenced_nodes.add(src)
+            referenced_nodes.add(dst)
+            if src not in nodes_set:
+                errors.append(f"Edge references missing node: {src}")
+            if dst not in nodes_set:
+                errors.append(f"Edge references missing node: {dst}")
 
+        # Check for orphan nodes
         orphan_nodes = [n for n in nodes if n not in referenced_nodes]
         if orphan_nodes:
             warnings.append(f"Orphan nodes detected: {orphan_nodes}")
 
-        # Check for missing dependencies
-        for edge in edges:
-            if edge[0] not in nodes:
-                errors.append(f"Edge references missing node: {edge[0]}")
-            if edge[1] not in nodes:
-                errors.append(f"Edge references missing node: {edge[1]}")
-
         return {
             "success": not errors,
             "valid": not errors,
@@ -270,14 +390,17 @@ class ReasoningAgent(Agent):
         nodes = dag_definition.get("nodes", [])
         edges = dag_definition.get("edges", [])
 
-        execution_order = await self._topological_sort(nodes, edges)
+        # Index the graph once for both the order and the parallel groups
+        names, indptr, indices = _index_graph(nodes, edges)
+        order = _topological_order(indptr, indices)
+        execution_order = [names[i] for i in order]
 
         # Identify parallel tasks
-        parallel_groups = await self._identify_parallel_groups(nodes, edges)
+        parallel_groups = _level_groups(names, indptr, indices, order)
 
         # Apply resource constraints
         max_parallel = resource_constraints.get("max_parallel", 4)
-        optimized_groups = await self._apply_resource_limits(
+        optimized_groups, total_nodes = self._apply_resource_limits(
             parallel_groups,
             max_parallel,
         )
@@ -286,10 +409,10 @@ class ReasoningAgent(Agent):
             "success": True,
             "execution_order": execution_order,
             "parallel_groups": optimized_groups,
-            "estimated_parallelism": sum(len(g) for g in optimized_groups) / len(optimized_groups),
+            "estimated_parallelism": total_nodes / max(len(optimized_groups), 1),
         }
 
-    async def _analyze_issues(
+    def _analyze_issues(
         self,
         project_snapshot: dict[str, Any],
         policy_set: dict[str, Any],
@@ -299,9 +422,9 @@ class ReasoningAgent(Agent):
         file_index = project_snapshot.get("file_index", {})
 
         # Check for security issues
-        for path, _info in file_index.items():
+        for path in file_index:
             # Check for sensitive file extensions
-            if any(ext in path.lower() for ext in [".env", ".secret", ".key", ".pem"]):
+            if _is_sensitive_path(path.lower()):
                 issues.append(
                     {
                         "type": "security",
@@ -311,10 +434,11 @@ class ReasoningAgent(Agent):
                     }
                 )
 
-        # Check for missing essential files
-        essential_files = ["README.md", "LICENSE"]
-        for essential in essential_files:
-            if essential not in file_index:
+        # Check for missing essential files; the set difference is empty in the common case,
+        # and the tuple keeps the reported order stable
+        missing = _ESSENTIAL_FILE_SET - file_index.keys()
+        for essential in _ESSENTIAL_FILES:
+            if essential in missing:
                 issues.append(
                     {
                         "type": "documentation",
@@ -326,43 +450,49 @@ class ReasoningAgent(Agent):
 
         return issues
 
-    async def _create_fix_steps(
+    def _create_fix_steps(
         self,
         issues: list[dict[str, Any]],
         context: dict[str, Any],
     ) -> list[dict[str, Any]]:
-        """Create fix steps for issues."""
-        steps = []
+        """Create fix steps for issues, highest priority first."""
+        # Steps carry their integer rank so the sort key is a C-level itemgetter
+        ranked: list[tuple[int, dict[str, Any]]] = []
 
         for issue in issues:
             if issue["type"] == "security":
-                steps.append(
-                    {
-                        "type": "review",
-                        "name": f"Review security issue: {issue['path']}",
-                        "description": issue["description"],
-                        "action": "manual_review",
-                        "priority": "high",
-                    }
+                ranked.append(
+                    (
+                        _STEP_PRIORITY["high"],
+                        {
+                            "type": "review",
+                            "name": f"Review security issue: {issue['path']}",
+                            "description": issue["description"],
+                            "action": "manual_review",
+                            "priority": "high",
+                        },
+                    )
                 )
             elif issue["type"] == "documentation":
-                steps.append(
-                    {
-                        "type": "file_write",
-                        "name": f"Create {issue['path']}",
-                        "file_path": issue["path"],
-                        "content": f"# {issue['path']}\n",
-                        "priority": "low",
-                    }
+                ranked.append(
+                    (
+                        _STEP_PRIORITY["low"],
+                        {
+                            "type": "file_write",
+                            "name": f"Create {issue['path']}",
+                            "file_path": issue["path"],
+                            "content": f"# {issue['path']}\n",
+                            "priority": "low",
+                        },
+                    )
                 )
 
-        # Sort by priority
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        steps.sort(key=lambda s: priority_order.get(s.get("priority", "low"), 3))
+        # Sort by priority (stable, so issue order is kept within a priority)
+        ranked.sort(key=itemgetter(0))
 
-        return steps
+        return [step for _, step in ranked]
 
-    async def _assess_plan_risks(
+    def _assess_plan_risks(
         self,
         steps: list[dict[str, Any]],
         context: dict[str, Any],
@@ -386,29 +516,36 @@ class ReasoningAgent(Agent):
             "risks": risks,
         }
 
-    async def _analyze_file_structure_risks(
+    def _scan_file_index(
         self,
         file_index: dict[str, Any],
-    ) -> list[dict[str, Any]]:
-        """Analyze file structure risks."""
-        risks = []
-
+        context: dict[str, Any],
+    ) -> Iterator[dict[str, Any]]:
+        """Yield structure, content and dependency risks from one pass over the index."""
         # Check for deeply nested files
-        for path in file_index.keys():
-            depth = path.count("/")
-            if depth > 10:
-                risks.append(
-                    {
-                        "type": "structure",
-                        "severity": "low",
-                        "description": f"Deeply nested file: {path}",
-                        "recommendation": "Consider flattening directory structure",
-                    }
-                )
-
-        return risks
-
-    async def _analyze_content_risks(
+        for path in file_index:
+            if path.count("/") > 10:
+                yield {
+                    "type": "structure",
+                    "severity": "low",
+                    "description": f"Deeply nested file: {path}",
+                    "recommendation": "Consider flattening directory structure",
+                }
+
+        yield from self._analyze_content_risks(file_index, context)
+
+        # Check for dependency files, reported in manifest order
+        present = _DEPENDENCY_FILE_SET & file_index.keys()
+        for dep_file in _DEPENDENCY_FILES:
+            if dep_file in present:
+                yield {
+                    "type": "dependencies",
+                    "severity": "low",
+                    "description": f"Dependency file found: {dep_file}",
+                    "recommendation": "Regularly update dependencies",
+                }
+
+    def _analyze_content_risks(
         self,
         file_index: dict[str, Any],
         context: dict[str, Any],
@@ -417,172 +554,120 @@ class ReasoningAgent(Agent):
         # In production, would scan file contents
         return []
 
-    async def _analyze_dependency_risks(
-        self,
-        file_index: dict[str, Any],
-        context: dict[str, Any],
-    ) -> list[dict[str, Any]]:
-        """Analyze dependency risks."""
-        risks = []
-
-        # Check for dependency files
-        dep_files = ["requirements.txt", "package.json", "go.mod", "Cargo.toml"]
-        for dep_file in dep_files:
-            if dep_file in file_index:
-                risks.append(
-                    {
-                        "type": "dependencies",
-                        "severity": "low",
-                        "description": f"Dependency file found: {dep_file}",
-                        "recommendation": "Regularly update dependencies",
-                    }
-                )
-
-        return risks
-
-    async def _generate_recommendations(
+    def _generate_recommendations(
         self,
         risks: list[dict[str, Any]],
         context: dict[str, Any],
     ) -> list[str]:
-        """Generate recommendations from risks."""
-        recommendations = set()
+        """Generate unique recommendations from risks, in first-seen order."""
+        return list(
+            dict.fromkeys([risk["recommendation"] for risk in risks if "recommendation" in risk])
+        )
 
-        for risk in risks:
-            if "recommendation" in risk:
-                recommendations.add(risk["recommendation"])
+    def _kahn(
+        self,
+        nodes: list[str],
+        edges: list[tuple[str, str]],
+    ) -> tuple[list[str], bool]:
+        """Topologically sort nodes with Kahn's algorithm.
 
-        return list(recommendations)
+        Returns the order and whether a cycle kept some nodes out of it. Edges
+        touching unknown nodes are ignored and duplicate nodes are sorted once.
+        """
+        names, indptr, indices = _index_graph(nodes, edges)
+        order = _topological_order(indptr, indices)
+        return [names[i] for i in order], len(order) != len(names)
 
-    async def _detect_cycle(
+    def _detect_cycle(
         self,
         nodes: list[str],
         edges: list[tuple[str, str]],
     ) -> bool:
         """Detect if a DAG has cycles."""
-        # Build adjacency list
-        adj = {node: [] for node in nodes}
-        for src, dst in edges:
-            if src in adj:
-                adj[src].append(dst)
-
-        # DFS for cycle detection
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node):
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in adj.get(node, []):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        for node in nodes:
-            if node not in visited:
-                if dfs(node):
-                    return True
-
-        return False
-
-    async def _topological_sort(
+        return self._kahn(nodes, edges)[1]
+
+    def _topological_sort(
         self,
         nodes: list[str],
         edges: list[tuple[str, str]],
     ) -> list[str]:
         """Compute topological order of nodes."""
-        # Build in-degree count
-        in_degree = {node: 0 for node in nodes}
-        adj = {node: [] for node in nodes}
-
-        for src, dst in edges:
-            if src in adj and dst in in_degree:
-                adj[src].append(dst)
-                in_degree[dst] += 1
-
-        # Queue for nodes with no dependencies
-        from collections import deque
-
-        queue = deque([node for node in nodes if in_degree[node] == 0])
-        result = []
-
-        while queue:
-            node = queue.popleft()
-            result.append(node)
+        return self._kahn(nodes, edges)[0]
 
-            for neighbor in adj.get(node, []):
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        return result
-
-    async def _identify_parallel_groups(
+    def _identify_parallel_groups(
         self,
         nodes: list[str],
         edges: list[tuple[str, str]],
     ) -> list[list[str]]:
-        """Identify groups of tasks that can run in parallel."""
-        # Simplified: use topological levels
-        topo_order = await self._topological_sort(nodes, edges)
-
-        groups = []
-        current_group = []
+        """Identify groups of tasks that can run in parallel.
 
-        # Build dependency map
-        dependencies = {node: set() for node in nodes}
-        for src, dst in edges:
-            if dst in dependencies:
-                dependencies[dst].add(src)
+        Each node's level is one more than the deepest of its dependencies, so
+        every group depends only on earlier groups. Nodes on cycles are left out.
+        """
+        names, indptr, indices = _index_graph(nodes, edges)
+        return _level_groups(names, indptr, indices, _topological_order(indptr, indices))
 
-        for node in topo_order:
-            # Check if all dependencies are in completed groups
-            all_deps_done = True
-            for dep in dependencies.get(node, set()):
-                dep_completed = any(dep in group for group in groups)
-                if not dep_completed:
-                    all_deps_done = False
-                    break
+    def _apply_resource_limits(
+        self,
+        parallel_groups: list[list[str]],
+        max_parallel: int,
+    ) -> tuple[list[list[str]], int]:
+        """Apply resource limits to parallel groups.
 
-            if all_deps_done and current_group:
-                groups.append(current_group)
-                current_group = []
+        Returns the split groups and the number of nodes they hold.
+        """
+        optimized: list[list[str]] = []
+        total = 0
 
-            current_group.append(node)
+        for group in parallel_groups:
+            total += len(group)
+            if len(group) <= max_parallel:
+                # Fits as-is; narrow levels skip the slice copy entirely
+                optimized.append(group)
+            else:
+                # Split group if it exceeds max_parallel
+                optimized.extend(
+                    [group[i : i + max_parallel] for i in range(0, len(group), max_parallel)]
+                )
 
-        if current_group:
-            groups.append(current_group)
+        return optimized, total
 
-        return groups
+    def _load_plans(self, state_dir: str) -> None:
+        """Load previous plans from ``state_dir/plans.json``, if present."""
+        plans_file = Path(state_dir) / _PLANS_FILE
 
-    async def _apply_resource_limits(
-        self,
-        parallel_groups: list[list[str]],
-        max_parallel: int,
-    ) -> list[list[str]]:
-        """Apply resource limits to parallel groups."""
-        optimized = []
+        try:
+            with open(plans_file, encoding="utf-8") as f:
+                data = json.load(f)
+            plans = {p["plan_id"]: RepairPlan(**p) for p in data.get("plans", [])}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # Missing or unreadable state starts the agent with no plans
+            return
 
-        for group in parallel_groups:
-            # Split group if it exceeds max_parallel
-            for i in range(0, len(group), max_parallel):
-                optimized.append(group[i : i + max_parallel])
+        with self._lock:
+            self._repair_plans.update(plans)
 
-        return optimized
+    def _save_plans(self, state_dir: str) -> None:
+        """Save all plans to ``state_dir/plans.json`` as one document."""
+        with self._lock:
+            plans = [plan.to_dict() for plan in self._repair_plans.values()]
 
-    async def _load_plans(self, state_dir: str) -> None:
-        """Load previous plans."""
-        pass
+        plans_file = Path(state_dir) / _PLANS_FILE
 
-    async def _save_plans(self, state_dir: str) -> None:
-        """Save plans."""
-        pass
+        # Write atomically so a crash mid-save never leaves a partial file
+        plans_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=plans_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"plans": plans}, f)
+            os.replace(tmp_path, plans_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _next_plan_id(self) -> str:
+        """Mint a collision-free plan ID."""
+        return f"plan_{self._start_ns}_{next(self._plan_seq)}_{self.agent_id}"
 
     def get_plan(self, plan_id: str) -> RepairPlan | None:
         """Get a repair plan by ID."""
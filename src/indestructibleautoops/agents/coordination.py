@@ -7,12 +7,15 @@ task scheduling, distribution, and execution across multiple agents.
 
 from __future__ import annotations
 
+import heapq
 import threading
 import time
 import uuid
+from collections import Counter, OrderedDict, defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import count
 from typing import Any
 
 from .base import AgentMessage, MessageType
@@ -32,7 +35,15 @@ class TaskStatus(Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+# Longest the scheduler sleeps without a signal, to pick up agents that become
+# available outside the coordinator (registered, or marked idle elsewhere)
+_IDLE_POLL_INTERVAL = 1.0
+
+# Statuses a waiter can return on
+_FINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
+@dataclass(slots=True)
 class Task:
     """A task that can be executed by an agent."""
 
@@ -71,7 +82,7 @@ class Task:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of a task execution."""
 
@@ -98,7 +109,7 @@ class TaskResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSelection:
     """Result of agent selection for a task."""
 
@@ -115,21 +126,65 @@ class AgentCoordinator:
         registry: AgentRegistry,
         communication: AgentCommunicationBus,
         max_concurrent_tasks: int = 10,
+        max_retained_completions: int | None = None,
     ):
         self.registry = registry
         self.communication = communication
         self.max_concurrent_tasks = max_concurrent_tasks
+        # Finished tasks kept with their results; older ones are forgotten.
+        # None keeps all. A forgotten task's result can no longer be waited on
+        # or satisfy a dependency, so keep this well above the number of tasks
+        # in flight at once.
+        self.max_retained_completions = max_retained_completions
 
         self._tasks: dict[str, Task] = {}
         self._results: dict[str, TaskResult] = {}
         self._running_tasks: dict[str, str] = {}  # task_id -> agent_id
-        self._pending_tasks: list[str] = []
-        self._completed_tasks: list[str] = []
-
-        self._lock = threading.RLock()
+        self._agent_load: Counter[str] = Counter()  # agent_id -> running task count
+        # Heap of (-priority, seq, task_id) for tasks whose dependencies are
+        # met: highest priority first, then submission order. _queued maps
+        # each queued task (ready or blocked) to the seq of its live entry;
+        # entries of cancelled or resubmitted tasks no longer match and are
+        # dropped lazily when popped.
+        self._pending_tasks: list[tuple[int, int, str]] = []
+        self._pending_seq = count()
+        self._queued: dict[str, int] = {}
+
+        # Tasks waiting on dependencies: their heap entry, how many
+        # dependencies are still unmet, and dependency -> waiting task IDs.
+        # A task moves to the heap when its last dependency completes.
+        self._blocked: dict[str, tuple[int, int, str]] = {}
+        self._unmet_deps: dict[str, int] = {}
+        self._dep_waiters: defaultdict[str, list[str]] = defaultdict(list)
+        # Finished task IDs, oldest first, for retention
+        self._completed_tasks: OrderedDict[str, None] = OrderedDict()
+        self._completed_count = 0
+
+        # Task IDs by status and by assigned agent, for list_tasks. Dicts
+        # rather than sets so each bucket keeps the order tasks entered it.
+        self._tasks_by_status: dict[TaskStatus, dict[str, None]] = {s: {} for s in TaskStatus}
+        self._tasks_by_agent: defaultdict[str, dict[str, None]] = defaultdict(dict)
+
+        # Completion events, created on demand by waiters and set (then
+        # dropped) when the task records a final result, with the number of
+        # threads waiting on each so the last to time out can drop it
+        self._completion_events: dict[str, threading.Event] = {}
+        self._completion_waiters: Counter[str] = Counter()
+
+        # Guards scheduling state: the pending queue, running tasks and status
+        # transitions. Tasks and results are only inserted, or popped once past
+        # retention, so single lookups and list(d.values()) snapshots are
+        # atomic under the CPython GIL and take no lock; status queries never
+        # wait on the scheduler.
+        self._lock = threading.Lock()
         self._running = False
         self._scheduler_thread: threading.Thread | None = None
 
+        # The scheduler sleeps on this until tasks are queued, a task finishes
+        # or a running task's timeout is due
+        self._wakeup = threading.Condition(self._lock)
+        self._work_signalled = False
+
     def start(self) -> None:
         """Start the coordination system."""
         with self._lock:
@@ -147,25 +202,56 @@ class AgentCoordinator:
         """Stop the coordination system."""
         with self._lock:
             self._running = False
-            if self._scheduler_thread:
-                self._scheduler_thread.join(timeout=5.0)
-                self._scheduler_thread = None
+            self._wakeup.notify()
+            thread, self._scheduler_thread = self._scheduler_thread, None
+
+        # Join outside the lock so the scheduler can finish its current pass
+        if thread:
+            thread.join(timeout=5.0)
 
     def submit_task(self, task: Task) -> str:
         """Submit a task for execution."""
+        # count() hands out sequence numbers atomically, so the heap entry is
+        # built before taking the lock
+        entry = (-task.priority, next(self._pending_seq), task.task_id)
         with self._lock:
-            self._tasks[task.task_id] = task
-            self._pending_tasks.append(task.task_id)
+            self._index_task(task)
+            self._queued[task.task_id] = entry[1]
+            if self._admit(task, entry):
+                heapq.heappush(self._pending_tasks, entry)
+                self._signal_work()
             return task.task_id
 
     def submit_tasks(self, tasks: Iterable[Task]) -> list[str]:
         """Submit multiple tasks for execution."""
-        task_ids = []
+        # Build the index and heap entries before taking the lock
+        task_list = list(tasks)
+        task_ids = [task.task_id for task in task_list]
+        by_id = dict(zip(task_ids, task_list, strict=True))
+        seq = self._pending_seq
+        entries = [(-task.priority, next(seq), task.task_id) for task in task_list]
+
         with self._lock:
-            for task in tasks:
-                self._tasks[task.task_id] = task
-                self._pending_tasks.append(task.task_id)
-                task_ids.append(task.task_id)
+            for task in by_id.values():
+                self._index_task(task)
+            # Later duplicates in the batch win, like in _tasks
+            self._queued.update((entry[2], entry[1]) for entry in entries)
+            ready = [
+                entry
+                for task, entry in zip(task_list, entries, strict=True)
+                if not task.depends_on or self._admit(task, entry)
+            ]
+            pending = self._pending_tasks
+            if len(ready) > len(pending):
+                # Re-heapifying is linear; cheaper than a push per entry here
+                pending.extend(ready)
+                heapq.heapify(pending)
+            else:
+                for entry in ready:
+                    heapq.heappush(pending, entry)
+            if ready:
+                self._signal_work()
+
         return task_ids
 
     def cancel_task(self, task_id: str) -> bool:
@@ -180,45 +266,57 @@ class AgentCoordinator:
             if task.status != TaskStatus.PENDING:
                 return False
 
-            task.status = TaskStatus.CANCELLED
-
-            if task_id in self._pending_tasks:
-                self._pending_tasks.remove(task_id)
+            self._set_status(task, TaskStatus.CANCELLED)
+            # A heap entry is dropped when popped; dependency completions
+            # skip a blocked one
+            self._queued.pop(task_id, None)
+            if task_id in self._blocked:
+                del self._blocked[task_id]
+                del self._unmet_deps[task_id]
 
             return True
 
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID."""
-        with self._lock:
-            return self._tasks.get(task_id)
+        return self._tasks.get(task_id)
 
     def get_result(self, task_id: str) -> TaskResult | None:
         """Get the result of a task."""
-        with self._lock:
-            return self._results.get(task_id)
+        return self._results.get(task_id)
 
     def get_task_status(self, task_id: str) -> TaskStatus | None:
         """Get the status of a task."""
-        with self._lock:
-            task = self._tasks.get(task_id)
-            return task.status if task else None
+        task = self._tasks.get(task_id)
+        return task.status if task else None
 
     def list_tasks(
         self,
         status: TaskStatus | None = None,
         agent_id: str | None = None,
     ) -> list[Task]:
-        """List tasks with optional filters."""
-        with self._lock:
-            tasks = list(self._tasks.values())
-
-            if status:
-                tasks = [t for t in tasks if t.status == status]
-
-            if agent_id:
-                tasks = [t for t in tasks if t.assigned_to == agent_id]
+        """List tasks with optional filters.
+
+        Filtered results come in the order tasks reached that status, or were
+        assigned to that agent.
+        """
+        if status:
+            task_ids = list(self._tasks_by_status[status])
+        elif agent_id:
+            task_ids = list(self._tasks_by_agent.get(agent_id, ()))
+        else:
+            return list(self._tasks.values())
 
-            return tasks
+        # The ID snapshot is taken without the lock, so recheck each task
+        # against the filters in case it moved on since
+        tasks = []
+        for task_id in task_ids:
+            task = self._tasks.get(task_id)
+            if task is None or (status and task.status != status):
+                continue
+            if agent_id and task.assigned_to != agent_id:
+                continue
+            tasks.append(task)
+        return tasks
 
     def wait_for_task(
         self,
@@ -226,22 +324,7 @@ class AgentCoordinator:
         timeout: float = 300.0,
     ) -> TaskResult | None:
         """Wait for a task to complete."""
-        start = time.time()
-
-        while time.time() - start < timeout:
-            with self._lock:
-                result = self._results.get(task_id)
-                if result:
-                    if result.status in (
-                        TaskStatus.COMPLETED,
-                        TaskStatus.FAILED,
-                        TaskStatus.CANCELLED,
-                    ):
-                        return result
-
-            time.sleep(0.1)
-
-        return None
+        return self._wait_for_result(task_id, timeout)
 
     def wait_for_tasks(
         self,
@@ -250,56 +333,124 @@ class AgentCoordinator:
     ) -> dict[str, TaskResult]:
         """Wait for multiple tasks to complete."""
         results: dict[str, TaskResult] = {}
-        start = time.time()
-
-        while time.time() - start < timeout and len(results) < len(task_ids):
-            for task_id in task_ids:
-                if task_id not in results:
-                    with self._lock:
-                        result = self._results.get(task_id)
-                        if result and result.status in (
-                            TaskStatus.COMPLETED,
-                            TaskStatus.FAILED,
-                            TaskStatus.CANCELLED,
-                        ):
-                            results[task_id] = result
-
-            time.sleep(0.1)
+        deadline = time.monotonic() + timeout
+
+        # Wait on each task in turn against one shared deadline
+        for task_id in task_ids:
+            result = self._wait_for_result(task_id, max(deadline - time.monotonic(), 0.0))
+            if result:
+                results[task_id] = result
 
         return results
 
+    def _wait_for_result(self, task_id: str, timeout: float) -> TaskResult | None:
+        """Block until a task has a final result; None if the timeout passes first."""
+        # Check and register under the lock so a completion can't slip in
+        # between; _complete_task sets and drops the event under it too
+        with self._lock:
+            result = self._results.get(task_id)
+            if result is not None and result.status in _FINAL_STATUSES:
+                return result
+            event = self._completion_events.get(task_id)
+            if event is None:
+                event = self._completion_events[task_id] = threading.Event()
+            self._completion_waiters[task_id] += 1
+
+        event.wait(timeout)
+
+        with self._lock:
+            waiters = self._completion_waiters[task_id] - 1
+            if waiters:
+                self._completion_waiters[task_id] = waiters
+            else:
+                del self._completion_waiters[task_id]
+                # Timed out as the last waiter: don't leave the event behind
+                if self._completion_events.get(task_id) is event:
+                    del self._completion_events[task_id]
+
+        result = self._results.get(task_id)
+        if result is None or result.status not in _FINAL_STATUSES:
+            return None
+        return result
+
     def _scheduler_loop(self) -> None:
         """Main scheduler loop."""
-        while self._running:
+        while True:
             try:
+                with self._wakeup:
+                    if self._running and not self._work_signalled:
+                        self._wakeup.wait(self._next_wakeup_delay())
+                    if not self._running:
+                        return
+                    self._work_signalled = False
+
                 self._schedule_tasks()
                 self._monitor_tasks()
-                time.sleep(0.1)
             except Exception:
                 pass
 
+    def _next_wakeup_delay(self) -> float:
+        """Seconds until the earliest running task times out, capped at the idle poll.
+
+        The idle poll picks up agents that become available outside the
+        coordinator. Caller holds the lock.
+        """
+        delay = _IDLE_POLL_INTERVAL
+        now = time.time()
+        for task_id in self._running_tasks:
+            task = self._tasks.get(task_id)
+            if task is None:
+                continue
+            delay = min(delay, task.created_at + task.timeout - now)
+        return max(delay, 0.0)
+
+    def _signal_work(self) -> None:
+        """Wake the scheduler for another pass. Caller holds the lock."""
+        self._work_signalled = True
+        self._wakeup.notify()
+
     def _schedule_tasks(self) -> None:
         """Schedule pending tasks to available agents."""
+        # Assignment messages, sent once the lock is released so a slow bus
+        # doesn't hold up submissions and completions
+        messages: list[AgentMessage] = []
         with self._lock:
             # Check if we have capacity
             if len(self._running_tasks) >= self.max_concurrent_tasks:
                 return
 
-            # Get ready tasks (dependencies satisfied)
-            ready_tasks = []
-            for task_id in self._pending_tasks:
-                task = self._tasks[task_id]
-                if self._are_dependencies_satisfied(task):
-                    ready_tasks.append(task)
+            # Try ready tasks in priority order, as many as we have capacity
+            # for. Tasks not scheduled this pass keep their heap entry, and
+            # with it their place in line.
+            pending = self._pending_tasks
+            slots = self.max_concurrent_tasks - len(self._running_tasks)
+            deferred = []
+            while slots and pending:
+                entry = heapq.heappop(pending)
+                _, seq, task_id = entry
+                if self._queued.get(task_id) != seq:
+                    # Cancelled, or superseded by a resubmission
+                    continue
 
-            # Sort by priority (higher first)
-            ready_tasks.sort(key=lambda t: t.priority, reverse=True)
+                task = self._tasks.get(task_id)
+                if task is None:
+                    # Finished elsewhere and since forgotten
+                    del self._queued[task_id]
+                    continue
 
-            # Schedule as many as we can
-            for task in ready_tasks[: self.max_concurrent_tasks - len(self._running_tasks)]:
+                slots -= 1
                 agent = self._select_agent_for_task(task)
                 if agent:
-                    self._assign_task_to_agent(task, agent)
+                    del self._queued[task_id]
+                    messages.append(self._assign_task_to_agent(task, agent))
+                else:
+                    deferred.append(entry)
+
+            for entry in deferred:
+                heapq.heappush(pending, entry)
+
+        for message in messages:
+            self.communication.send(message)
 
     def _monitor_tasks(self) -> None:
         """Monitor running tasks for timeouts."""
@@ -317,41 +468,18 @@ class AgentCoordinator:
 
     def _select_agent_for_task(self, task: Task) -> AgentSelection | None:
         """Select the best agent for a task."""
-        # Find agents with required capabilities
-        candidates = self.registry.find_by_capabilities(task.required_capabilities)
-
-        if not candidates:
-            return None
-
-        # Filter by tags if specified
-        if task.required_tags:
-            tagged_candidates = []
-            for agent_id in candidates:
-                metadata = self.registry.get_metadata(agent_id)
-                if metadata and all(tag in metadata.tags for tag in task.required_tags):
-                    tagged_candidates.append(agent_id)
-            candidates = tagged_candidates
-
-        if not candidates:
-            return None
+        # Idle agents with the required capabilities and tags, in one index lookup
+        candidates = self.registry.find_available(task.required_capabilities, task.required_tags)
 
         # Score candidates
         scored = []
         for agent_id in candidates:
-            metadata = self.registry.get_metadata(agent_id)
-            if not metadata or metadata.state != "idle":
-                continue
-
-            score = 0.0
-            reasons = []
-
-            # Prefer idle agents
-            if metadata.state == "idle":
-                score += 10.0
-                reasons.append("agent_idle")
+            # Prefer idle agents; every candidate is idle
+            score = 10.0
+            reasons = ["agent_idle"]
 
             # Consider load (fewer running tasks is better)
-            running_count = sum(1 for t in self._running_tasks.values() if t == agent_id)
+            running_count = self._agent_load[agent_id]
             score -= running_count * 2.0
             if running_count == 0:
                 reasons.append("no_load")
@@ -368,16 +496,19 @@ class AgentCoordinator:
         scored.sort(key=lambda s: s.score, reverse=True)
         return scored[0]
 
-    def _assign_task_to_agent(self, task: Task, selection: AgentSelection) -> None:
-        """Assign a task to an agent."""
-        task.assigned_to = selection.agent_id
-        task.status = TaskStatus.ASSIGNED
+    def _assign_task_to_agent(self, task: Task, selection: AgentSelection) -> AgentMessage:
+        """Assign a task to an agent, returning the assignment message for the caller to send.
+
+        The agent is marked busy right away so later tasks in the same pass
+        pick another one.
+        """
+        self._set_assignee(task, selection.agent_id)
+        self._set_status(task, TaskStatus.ASSIGNED)
 
         self._running_tasks[task.task_id] = selection.agent_id
-        if task.task_id in self._pending_tasks:
-            self._pending_tasks.remove(task.task_id)
+        self._agent_load[selection.agent_id] += 1
 
-        # Send task assignment message
+        # Task assignment message, built now so it carries the task as assigned
         message = AgentMessage(
             msg_type=MessageType.TASK_ASSIGN,
             sender_id="coordinator",
@@ -388,10 +519,9 @@ class AgentCoordinator:
             },
         )
 
-        self.communication.send(message)
-
         # Update registry
         self.registry.update_agent_state(selection.agent_id, "busy")
+        return message
 
     def _handle_task_complete(
         self,
@@ -400,30 +530,43 @@ class AgentCoordinator:
     ) -> None:
         """Handle a completed task."""
         with self._lock:
-            if task_id in self._running_tasks:
-                del self._running_tasks[task_id]
+            self._complete_task(task_id, result)
 
-            task = self._tasks.get(task_id)
-            if task:
-                task.status = result.status
-                if result.agent_id:
-                    self.registry.update_agent_state(result.agent_id, "idle")
+    def _complete_task(self, task_id: str, result: TaskResult) -> None:
+        """Record a task result. Caller holds the lock."""
+        self._release_running(task_id)
+
+        task = self._tasks.get(task_id)
+        if task:
+            self._set_status(task, result.status)
+            if result.agent_id:
+                self.registry.update_agent_state(result.agent_id, "idle")
+
+        self._results[task_id] = result
+        self._retain_completion(task_id)
+        if result.status == TaskStatus.COMPLETED:
+            self._release_dependents(task_id)
 
-            self._results[task_id] = result
-            self._completed_tasks.append(task_id)
+        # A slot and possibly an agent are free, and dependents may be ready
+        self._signal_work()
+
+        # Wake any waiters
+        if result.status in _FINAL_STATUSES:
+            event = self._completion_events.pop(task_id, None)
+            if event:
+                event.set()
 
     def _handle_task_timeout(self, task: Task, agent_id: str) -> None:
         """Handle a task that has timed out."""
         if task.retry_count < task.max_retries:
             # Retry the task
             task.retry_count += 1
-            task.status = TaskStatus.RETRYING
-            task.assigned_to = None
+            self._set_status(task, TaskStatus.RETRYING)
+            self._set_assignee(task, None)
 
-            if task.task_id in self._running_tasks:
-                del self._running_tasks[task.task_id]
+            self._release_running(task.task_id)
 
-            self._pending_tasks.append(task.task_id)
+            self._push_pending(task)
             self.registry.update_agent_state(agent_id, "idle")
         else:
             # Mark as failed
@@ -433,24 +576,123 @@ class AgentCoordinator:
                 error="Task timed out",
                 agent_id=agent_id,
             )
-            self._handle_task_complete(task.task_id, result)
-
-    def _are_dependencies_satisfied(self, task: Task) -> bool:
-        """Check if all task dependencies are satisfied."""
+            self._complete_task(task.task_id, result)
+
+    def _retain_completion(self, task_id: str) -> None:
+        """Record a finished task, forgetting the oldest past retention. Caller holds the lock."""
+        self._completed_count += 1
+        completed = self._completed_tasks
+        completed[task_id] = None
+        completed.move_to_end(task_id)
+
+        limit = self.max_retained_completions
+        while limit is not None and len(completed) > limit:
+            old_id, _ = completed.popitem(last=False)
+            old_task = self._tasks.get(old_id)
+            if old_task and old_task.status not in _FINAL_STATUSES:
+                # Resubmitted under the same ID and not finished yet
+                continue
+            if old_task:
+                del self._tasks[old_id]
+                self._unindex_task(old_task)
+            self._results.pop(old_id, None)
+
+    def _index_task(self, task: Task) -> None:
+        """Store a submitted task, replacing any with the same ID. Caller holds the lock."""
+        old = self._tasks.get(task.task_id)
+        if old:
+            self._unindex_task(old)
+        self._tasks[task.task_id] = task
+        self._tasks_by_status[task.status][task.task_id] = None
+        if task.assigned_to:
+            self._tasks_by_agent[task.assigned_to][task.task_id] = None
+
+    def _unindex_task(self, task: Task) -> None:
+        """Drop a task from the status and agent indexes. Caller holds the lock."""
+        self._tasks_by_status[task.status].pop(task.task_id, None)
+        self._drop_assignment(task)
+
+    def _set_status(self, task: Task, status: TaskStatus) -> None:
+        """Move a task to a new status. Caller holds the lock."""
+        by_status = self._tasks_by_status
+        by_status[task.status].pop(task.task_id, None)
+        task.status = status
+        by_status[status][task.task_id] = None
+
+    def _set_assignee(self, task: Task, agent_id: str | None) -> None:
+        """Assign a task to an agent, or clear it with None. Caller holds the lock."""
+        self._drop_assignment(task)
+        task.assigned_to = agent_id
+        if agent_id:
+            self._tasks_by_agent[agent_id][task.task_id] = None
+
+    def _drop_assignment(self, task: Task) -> None:
+        """Remove a task from its agent's index bucket. Caller holds the lock."""
+        agent_id = task.assigned_to
+        assigned = self._tasks_by_agent.get(agent_id) if agent_id else None
+        if assigned is not None:
+            assigned.pop(task.task_id, None)
+            if not assigned:
+                del self._tasks_by_agent[agent_id]
+
+    def _release_running(self, task_id: str) -> None:
+        """Drop a task from the running set. Caller holds the lock."""
+        agent_id = self._running_tasks.pop(task_id, None)
+        if agent_id is not None:
+            load = self._agent_load[agent_id] - 1
+            if load:
+                self._agent_load[agent_id] = load
+            else:
+                del self._agent_load[agent_id]
+
+    def _push_pending(self, task: Task) -> None:
+        """Queue a task for scheduling. Caller holds the lock."""
+        seq = next(self._pending_seq)
+        self._queued[task.task_id] = seq
+        heapq.heappush(self._pending_tasks, (-task.priority, seq, task.task_id))
+        self._signal_work()
+
+    def _admit(self, task: Task, entry: tuple[int, int, str]) -> bool:
+        """Check a new task's dependencies, parking it if any are unmet.
+
+        Returns whether the task is ready for the heap. Caller holds the lock.
+        """
+        unmet = set()
         for dep_id in task.depends_on:
             dep_result = self._results.get(dep_id)
             if not dep_result or dep_result.status != TaskStatus.COMPLETED:
-                return False
-        return True
+                unmet.add(dep_id)
+        if not unmet:
+            return True
+
+        task_id = task.task_id
+        self._blocked[task_id] = entry
+        self._unmet_deps[task_id] = len(unmet)
+        for dep_id in unmet:
+            self._dep_waiters[dep_id].append(task_id)
+        return False
+
+    def _release_dependents(self, task_id: str) -> None:
+        """Count a completed dependency against its waiting tasks. Caller holds the lock."""
+        for waiter_id in self._dep_waiters.pop(task_id, ()):
+            remaining = self._unmet_deps.get(waiter_id)
+            if remaining is None:
+                # Cancelled while waiting
+                continue
+            if remaining > 1:
+                self._unmet_deps[waiter_id] = remaining - 1
+            else:
+                del self._unmet_deps[waiter_id]
+                heapq.heappush(self._pending_tasks, self._blocked.pop(waiter_id))
 
     def get_coordinator_stats(self) -> dict[str, Any]:
         """Get statistics about the coordinator."""
         with self._lock:
             return {
                 "total_tasks": len(self._tasks),
-                "pending_tasks": len(self._pending_tasks),
+                "pending_tasks": len(self._queued),
                 "running_tasks": len(self._running_tasks),
-                "completed_tasks": len(self._completed_tasks),
+                "completed_tasks": self._completed_count,
                 "max_concurrent": self.max_concurrent_tasks,
                 "running": self._running,
             }
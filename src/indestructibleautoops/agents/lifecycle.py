@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
+from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -32,7 +33,11 @@ class AgentState(Enum):
     TERMINATED = "terminated"
 
 
-@dataclass
+# States in which an agent receives heartbeats and can take work
+_ALIVE_STATES = frozenset({AgentState.READY, AgentState.BUSY, AgentState.IDLE})
+
+
+@dataclass(slots=True)
 class AgentInstance:
     """Represents a running agent instance."""
 
@@ -70,6 +75,11 @@ class AgentLifecycle:
         self._instances: dict[str, AgentInstance] = {}
         self._agent_types: dict[str, type[Agent]] = {}
 
+        # Instance counts by state and by type, kept in step with _instances
+        # so stats never scan the fleet
+        self._state_counts: Counter[AgentState] = Counter()
+        self._type_counts: Counter[str] = Counter()
+
         self._lock = threading.RLock()
         self._running = False
         self._monitor_thread: threading.Thread | None = None
@@ -114,7 +124,7 @@ class AgentLifecycle:
                 agent_type=agent_type,
             )
 
-            self._instances[agent_id] = instance
+            self._add_instance(agent_id, instance)
 
             # Register with communication bus
             self.communication.register_agent(agent_id)
@@ -135,8 +145,7 @@ class AgentLifecycle:
         except Exception:
             # Cleanup on failure
             with self._lock:
-                if agent_id in self._instances:
-                    del self._instances[agent_id]
+                self._remove_instance(agent_id)
 
                 self.communication.unregister_agent(agent_id)
 
@@ -145,14 +154,22 @@ class AgentLifecycle:
     async def spawn_agents(
         self,
         specs: list[tuple[str, str, dict[str, Any] | None, list[str] | None]],
+        max_concurrent_spawns: int = 8,
     ) -> list[AgentInstance]:
-        """Spawn multiple agents concurrently."""
-        tasks = [
-            self.spawn_agent(agent_type, agent_id, config, tags)
-            for agent_type, agent_id, config, tags in specs
-        ]
+        """Spawn multiple agents concurrently, at most max_concurrent_spawns at a time."""
+        # Bound the fan-out so a large burst does not initialize every agent at once
+        semaphore = asyncio.Semaphore(max_concurrent_spawns)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def spawn(
+            agent_type: str,
+            agent_id: str,
+            config: dict[str, Any] | None,
+            tags: list[str] | None,
+        ) -> AgentInstance | None:
+            async with semaphore:
+                return await self.spawn_agent(agent_type, agent_id, config, tags)
+
+        results = await asyncio.gather(*(spawn(*spec) for spec in specs), return_exceptions=True)
 
         instances = []
         for result in results:
@@ -172,7 +189,7 @@ class AgentLifecycle:
                 return False
 
             old_state = instance.state
-            instance.state = AgentState.SHUTTING_DOWN
+            self._set_state(agent_id, instance, AgentState.SHUTTING_DOWN)
 
             # Notify state change
             self._notify_state_change(agent_id, old_state, instance.state)
@@ -195,7 +212,7 @@ class AgentLifecycle:
 
             # Update state
             with self._lock:
-                instance.state = AgentState.TERMINATED
+                self._set_state(agent_id, instance, AgentState.TERMINATED)
                 self._notify_state_change(agent_id, old_state, instance.state)
 
             # Unregister
@@ -204,14 +221,14 @@ class AgentLifecycle:
 
             # Remove instance
             with self._lock:
-                del self._instances[agent_id]
+                self._remove_instance(agent_id)
 
             return True
 
         except Exception as e:
             # Handle error
             with self._lock:
-                instance.state = AgentState.ERROR
+                self._set_state(agent_id, instance, AgentState.ERROR)
                 instance.error_count += 1
 
             self._notify_error(agent_id, e)
@@ -222,8 +239,7 @@ class AgentLifecycle:
                 self.communication.unregister_agent(agent_id)
 
                 with self._lock:
-                    if agent_id in self._instances:
-                        del self._instances[agent_id]
+                    self._remove_instance(agent_id)
             except Exception:
                 pass
 
@@ -270,8 +286,7 @@ class AgentLifecycle:
 
     def is_alive(self, agent_id: str) -> bool:
         """Check if an agent is alive."""
-        state = self.get_state(agent_id)
-        return state in (AgentState.READY, AgentState.BUSY, AgentState.IDLE)
+        return self.get_state(agent_id) in _ALIVE_STATES
 
     def start_monitoring(self) -> None:
         """Start the monitoring thread."""
@@ -308,24 +323,31 @@ class AgentLifecycle:
         """Check agent heartbeats."""
         now = time.time()
 
+        # Snapshot live agents, then send without holding the lock
+        with self._lock:
+            alive = [
+                (agent_id, instance)
+                for agent_id, instance in self._instances.items()
+                if instance.state in _ALIVE_STATES
+            ]
+
+        self.communication.multicast(
+            [agent_id for agent_id, _ in alive],
+            MessageType.HEARTBEAT,
+            sender_id="lifecycle",
+        )
+
+        # Check for stale agents
+        stale_after = self.heartbeat_interval * 2
         with self._lock:
-            for agent_id, instance in self._instances.items():
-                if not self.is_alive(agent_id):
+            for agent_id, instance in alive:
+                # Skip agents terminated or changed state since the snapshot
+                if instance.state not in _ALIVE_STATES:
                     continue
-
-                # Send heartbeat
-                heartbeat_msg = AgentMessage(
-                    msg_type=MessageType.HEARTBEAT,
-                    sender_id="lifecycle",
-                    recipient_id=agent_id,
-                )
-                self.communication.send(heartbeat_msg)
-
-                # Check for stale agents
-                if now - instance.last_heartbeat > self.heartbeat_interval * 2:
+                if now - instance.last_heartbeat > stale_after:
                     # Mark as error
                     old_state = instance.state
-                    instance.state = AgentState.ERROR
+                    self._set_state(agent_id, instance, AgentState.ERROR)
                     self._notify_state_change(agent_id, old_state, instance.state)
 
     def _check_health(self) -> None:
@@ -336,18 +358,45 @@ class AgentLifecycle:
 
     async def _initialize_agent(self, instance: AgentInstance) -> None:
         """Initialize an agent."""
+        agent_id = instance.agent.agent_id
         old_state = instance.state
-        instance.state = AgentState.INITIALIZING
-        self._notify_state_change(instance.agent.agent_id, old_state, instance.state)
+        self._set_state(agent_id, instance, AgentState.INITIALIZING)
+        self._notify_state_change(agent_id, old_state, instance.state)
 
         # Call initialize
         await instance.agent.initialize()
 
         # Update state
         old_state = instance.state
-        instance.state = AgentState.READY
+        self._set_state(agent_id, instance, AgentState.READY)
         instance.started_at = time.time()
-        self._notify_state_change(instance.agent.agent_id, old_state, instance.state)
+        self._notify_state_change(agent_id, old_state, instance.state)
+
+    def _add_instance(self, agent_id: str, instance: AgentInstance) -> None:
+        """Track a new instance. Caller holds the lock."""
+        self._instances[agent_id] = instance
+        self._state_counts[instance.state] += 1
+        self._type_counts[instance.agent_type] += 1
+
+    def _remove_instance(self, agent_id: str) -> None:
+        """Stop tracking an instance, if present. Caller holds the lock."""
+        instance = self._instances.pop(agent_id, None)
+        if instance is None:
+            return
+
+        self._state_counts[instance.state] -= 1
+        self._type_counts[instance.agent_type] -= 1
+        if not self._type_counts[instance.agent_type]:
+            del self._type_counts[instance.agent_type]
+
+    def _set_state(self, agent_id: str, instance: AgentInstance, state: AgentState) -> None:
+        """Move an instance to a new state, keeping the state counts current."""
+        with self._lock:
+            # Instances already removed from tracking are no longer counted
+            if self._instances.get(agent_id) is instance:
+                self._state_counts[instance.state] -= 1
+                self._state_counts[state] += 1
+            instance.state = state
 
     def _notify_state_change(
         self,
@@ -405,16 +454,8 @@ class AgentLifecycle:
         with self._lock:
             return {
                 "total_instances": len(self._instances),
-                "by_state": {
-                    state.value: len([i for i in self._instances.values() if i.state == state])
-                    for state in AgentState
-                },
-                "by_type": {
-                    agent_type: len(
-                        [i for i in self._instances.values() if i.agent_type == agent_type]
-                    )
-                    for agent_type in set(i.agent_type for i in self._instances.values())
-                },
+                "by_state": {state.value: self._state_counts[state] for state in AgentState},
+                "by_type": dict(self._type_counts),
                 "total_errors": sum(i.error_count for i in self._instances.values()),
                 "total_tasks": sum(i.task_count for i in self._instances.values()),
                 "running": self._running,
@@ -11,7 +11,7 @@ import re
 import threading
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -149,11 +149,117 @@ class PolicyViolation:
         }
 
 
+_NUMBER = (int, float)
+
+
+def _compile_getter(key: str) -> Callable[[Any], Any]:
+    """Compile a dot-notation key into a context lookup."""
+    if "." not in key:
+        return lambda data: data.get(key) if isinstance(data, dict) else None
+
+    keys = tuple(key.split("."))
+
+    def get(data: Any) -> Any:
+        for k in keys:
+            if isinstance(data, dict) and k in data:
+                data = data[k]
+            else:
+                return None
+        return data
+
+    return get
+
+
+def _compile_operator(operator: str, value: Any) -> Callable[[Any], bool] | None:
+    """Compile one condition operator into a predicate; unknown operators are ignored."""
+    if operator == "eq":
+        return lambda actual: not (actual != value)
+    if operator == "ne":
+        return lambda actual: not (actual == value)
+    if operator == "gt":
+        return lambda actual: isinstance(actual, _NUMBER) and actual > value
+    if operator == "lt":
+        return lambda actual: isinstance(actual, _NUMBER) and actual < value
+    if operator == "gte":
+        return lambda actual: isinstance(actual, _NUMBER) and actual >= value
+    if operator == "lte":
+        return lambda actual: isinstance(actual, _NUMBER) and actual <= value
+    if operator in ("in", "not_in"):
+        negate = operator == "not_in"
+        members: Any = value
+        if isinstance(value, (list, tuple, set, frozenset)):
+            try:
+                members = frozenset(value)
+            except TypeError:
+                pass
+
+        def member(actual: Any) -> bool:
+            try:
+                found = actual in members
+            except TypeError:
+                # Unhashable value tested against a hashed set
+                found = actual in value
+            return found is not negate
+
+        return member
+    if operator == "contains":
+        return lambda actual: value in str(actual)
+    if operator == "not_contains":
+        return lambda actual: value not in str(actual)
+    if operator == "regex":
+        try:
+            search = re.compile(value).search
+        except (re.error, TypeError):
+            # Keep the original error for evaluation time
+            return lambda actual: bool(re.search(value, str(actual)))
+        return lambda actual: search(str(actual)) is not None
+    return None
+
+
+def _compile_condition(expected: Any) -> Callable[[Any], bool]:
+    """Compile an expected value or operator dict into a predicate."""
+    if not isinstance(expected, dict):
+        return lambda actual: actual == expected
+
+    checks = tuple(
+        check
+        for operator, value in expected.items()
+        if (check := _compile_operator(operator, value)) is not None
+    )
+    if not checks:
+        return lambda actual: True
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(actual: Any) -> bool:
+        for check in checks:
+            if not check(actual):
+                return False
+        return True
+
+    return check_all
+
+
 class PolicyEvaluator:
-    """Evaluates a single policy against a context."""
+    """Evaluates a single policy against a context.
+
+    Conditions and the rule pattern are compiled once, when the evaluator is
+    created, so later edits to the policy's conditions need a new evaluator.
+    """
 
     def __init__(self, policy: Policy):
         self.policy = policy
+        self._conditions = tuple(
+            (_compile_getter(key), _compile_condition(expected))
+            for key, expected in policy.conditions.items()
+        )
+        self._pattern_search: Callable[[str], Any] | None = None
+        if policy.rule_pattern:
+            try:
+                self._pattern_search = re.compile(policy.rule_pattern).search
+            except re.error:
+                pattern = policy.rule_pattern
+                self._pattern_search = lambda text: re.search(pattern, text)
 
     def evaluate(
         self,
@@ -164,86 +270,13 @@ class PolicyEvaluator:
             return True
 
         # Check conditions
-        for key, expected_value in self.policy.conditions.items():
-            actual_value = self._get_nested_value(context, key)
-
-            if not self._evaluate_condition(
-                actual_value,
-                expected_value,
-            ):
+        for get, check in self._conditions:
+            if not check(get(context)):
                 return False
 
         # Check rule pattern if specified
-        if self.policy.rule_pattern:
-            context_str = str(context)
-            if not re.search(self.policy.rule_pattern, context_str):
-                return False
-
-        return True
-
-    def _get_nested_value(
-        self,
-        data: dict[str, Any],
-        key: str,
-    ) -> Any:
-        """Get a nested value from a dictionary using dot notation."""
-        keys = key.split(".")
-        value = data
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return None
-
-        return value
-
-    def _evaluate_condition(
-        self,
-        actual: Any,
-        expected: Any,
-    ) -> bool:
-        """Evaluate a single condition."""
-        # Handle dict-based conditions (operators)
-        if isinstance(expected, dict):
-            for operator, value in expected.items():
-                if operator == "eq":
-                    if actual != value:
-                        return False
-                elif operator == "ne":
-                    if actual == value:
-                        return False
-                elif operator == "gt":
-                    if not (isinstance(actual, (int, float)) and actual > value):
-                        return False
-                elif operator == "lt":
-                    if not (isinstance(actual, (int, float)) and actual < value):
-                        return False
-                elif operator == "gte":
-                    if not (isinstance(actual, (int, float)) and actual >= value):
-                        return False
-                elif operator == "lte":
-                    if not (isinstance(actual, (int, float)) and actual <= value):
-                        return False
-                elif operator == "in":
-                    if actual not in value:
-                        return False
-                elif operator == "not_in":
-                    if actual in value:
-                        return False
-                elif operator == "contains":
-                    if value not in str(actual):
-                        return False
-                elif operator == "regex":
-                    if not re.search(value, str(actual)):
-                        return False
-                elif operator == "not_contains":
-                    if value in str(actual):
-                        return False
-
-        else:
-            # Simple equality check
-            return actual == expected
+        if self._pattern_search is not None and not self._pattern_search(str(context)):
+            return False
 
         return True
 
@@ -265,6 +298,13 @@ class PolicyEngine:
             self._policies[policy.policy_id] = policy
             self._evaluators[policy.policy_id] = PolicyEvaluator(policy)
 
+    def add_policies(self, policies: list[Policy]) -> None:
+        """Add several policies to the engine under a single lock acquisition."""
+        with self._lock:
+            for policy in policies:
+                self._policies[policy.policy_id] = policy
+                self._evaluators[policy.policy_id] = PolicyEvaluator(policy)
+
     def remove_policy(self, policy_id: str) -> bool:
         """Remove a policy from the engine."""
         with self._lock:
@@ -303,13 +343,27 @@ class PolicyEngine:
         context: dict[str, Any],
         agent_tags: list[str] | None = None,
         block_on_critical: bool = True,
+        candidate_policy_ids: Iterable[str] | None = None,
     ) -> tuple[bool, list[PolicyViolation]]:
-        """Evaluate an action against all applicable policies."""
+        """Evaluate an action against all applicable policies.
+
+        When candidate_policy_ids is given, only those policies are evaluated.
+        """
         violations: list[PolicyViolation] = []
         blocked = False
 
         with self._lock:
-            for policy_id, evaluator in self._evaluators.items():
+            if candidate_policy_ids is None:
+                candidates = self._evaluators.items()
+            else:
+                evaluators = self._evaluators
+                candidates = [
+                    (policy_id, evaluators[policy_id])
+                    for policy_id in candidate_policy_ids
+                    if policy_id in evaluators
+                ]
+
+            for policy_id, evaluator in candidates:
                 policy = self._policies[policy_id]
 
                 # Check if policy applies
@@ -39,6 +39,7 @@ class AgentRegistry:
         self._lock = threading.RLock()
         self._capabilities_index: dict[str, set[str]] = {}
         self._tag_index: dict[str, set[str]] = {}
+        self._idle_agents: set[str] = set()
         self._listeners: list[Callable[[str, str], None]] = []
 
     def register(
@@ -67,6 +68,7 @@ class AgentRegistry:
             # Build indexes
             self._index_capabilities(agent_id, agent.capabilities)
             self._index_tags(agent_id, tags or [])
+            self._idle_agents.add(agent_id)
 
             # Notify listeners
             self._notify_listeners(agent_id, "registered")
@@ -86,6 +88,7 @@ class AgentRegistry:
                 self._capabilities_index[cap].discard(agent_id)
             for tag in metadata.tags:
                 self._tag_index[tag].discard(agent_id)
+            self._idle_agents.discard(agent_id)
 
             # Remove from registry
             del self._agents[agent_id]
@@ -143,6 +146,17 @@ class AgentRegistry:
 
             return list(set.intersection(*result_sets))
 
+    def find_available(
+        self,
+        capabilities: Iterable[str],
+        tags: Iterable[str] = (),
+    ) -> list[str]:
+        """Find idle agent IDs that have all specified capabilities and tags."""
+        with self._lock:
+            result_sets = [self._capabilities_index.get(cap, set()) for cap in capabilities]
+            result_sets.extend(self._tag_index.get(tag, set()) for tag in tags)
+            return list(self._idle_agents.intersection(*result_sets))
+
     def find_by_tag(self, tag: str) -> list[str]:
         """Find agent IDs that have a specific tag."""
         with self._lock:
@@ -166,6 +180,10 @@ class AgentRegistry:
             if agent_id in self._metadata:
                 self._metadata[agent_id].state = state
                 self._metadata[agent_id].last_seen = time.time()
+                if state == "idle":
+                    self._idle_agents.add(agent_id)
+                else:
+                    self._idle_agents.discard(agent_id)
 
     def get_available_agents(self) -> list[AgentMetadata]:
         """Get all agents that are currently available (idle)."""
@@ -0,0 +1,278 @@
+"""Tests for the agent coordinator's scheduling behavior."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from indestructibleautoops.agents.base import Agent
+from indestructibleautoops.agents.communication import AgentCommunicationBus
+from indestructibleautoops.agents.coordination import (
+    AgentCoordinator,
+    Task,
+    TaskResult,
+    TaskStatus,
+)
+from indestructibleautoops.agents.registry import AgentRegistry
+
+
+class _IdleAgent(Agent):
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def execute_task(self, task, context):
+        return {}
+
+
+def _coordinator(agents: int = 1, **kwargs) -> AgentCoordinator:
+    registry = AgentRegistry()
+    bus = AgentCommunicationBus()
+    for i in range(agents):
+        registry.register(_IdleAgent(f"agent{i}", []), "idle")
+        bus.register_agent(f"agent{i}")
+    return AgentCoordinator(registry, bus, **kwargs)
+
+
+def _finish(co: AgentCoordinator, task_id: str, status=TaskStatus.COMPLETED) -> None:
+    """Report a running task's result, as its agent would."""
+    agent_id = co._running_tasks[task_id]
+    co._handle_task_complete(task_id, TaskResult(task_id=task_id, status=status, agent_id=agent_id))
+
+
+def _run_order(co: AgentCoordinator) -> list[str]:
+    """Schedule and complete tasks one pass at a time, recording assignment order."""
+    order = []
+    while True:
+        co._schedule_tasks()
+        running = list(co._running_tasks)
+        if not running:
+            return order
+        for task_id in running:
+            order.append(task_id)
+            _finish(co, task_id)
+
+
+class TestPendingQueue:
+    def test_priority_then_submission_order(self):
+        co = _coordinator()
+        co.submit_tasks(
+            [
+                Task(task_id="low", priority=0),
+                Task(task_id="high1", priority=5),
+                Task(task_id="mid", priority=2),
+                Task(task_id="high2", priority=5),
+            ]
+        )
+        assert _run_order(co) == ["high1", "high2", "mid", "low"]
+
+    def test_cancelled_task_never_runs(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="a"))
+        co.submit_task(Task(task_id="b"))
+        assert co.cancel_task("a")
+
+        assert co.get_coordinator_stats()["pending_tasks"] == 1
+        assert _run_order(co) == ["b"]
+        assert co.get_task_status("a") == TaskStatus.CANCELLED
+
+    def test_resubmitted_cancelled_task_uses_new_entry(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="other", priority=1))
+        co.submit_task(Task(task_id="x"))
+        co.cancel_task("x")
+        co.submit_task(Task(task_id="x", priority=5))
+
+        assert co.get_coordinator_stats()["pending_tasks"] == 2
+        assert _run_order(co) == ["x", "other"]
+        assert co.get_coordinator_stats()["pending_tasks"] == 0
+
+    def test_resubmitting_pending_task_runs_it_once(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="x"))
+        co.submit_task(Task(task_id="x"))
+
+        assert co.get_coordinator_stats()["pending_tasks"] == 1
+        assert _run_order(co) == ["x"]
+
+
+class TestDependencies:
+    def test_blocked_task_waits_for_its_dependency(self):
+        co = _coordinator()
+        co.submit_tasks(
+            [Task(task_id="child", priority=9, depends_on=["parent"]), Task(task_id="parent")]
+        )
+
+        assert co.get_coordinator_stats()["pending_tasks"] == 2
+        assert _run_order(co) == ["parent", "child"]
+
+    def test_task_waits_for_every_dependency(self):
+        co = _coordinator(agents=2)
+        co.submit_task(Task(task_id="join", depends_on=["a", "b"]))
+        co.submit_tasks([Task(task_id="a"), Task(task_id="b")])
+
+        co._schedule_tasks()
+        assert sorted(co._running_tasks) == ["a", "b"]
+        _finish(co, "a")
+        co._schedule_tasks()
+        assert list(co._running_tasks) == ["b"]
+        _finish(co, "b")
+        assert _run_order(co) == ["join"]
+
+    def test_failed_dependency_keeps_task_blocked(self):
+        co = _coordinator()
+        co.submit_tasks([Task(task_id="parent"), Task(task_id="child", depends_on=["parent"])])
+        co._schedule_tasks()
+        _finish(co, "parent", TaskStatus.FAILED)
+
+        assert _run_order(co) == []
+        assert co.get_task_status("child") == TaskStatus.PENDING
+        assert co.get_coordinator_stats()["pending_tasks"] == 1
+
+    def test_dependency_already_completed_at_submit(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="parent"))
+        assert _run_order(co) == ["parent"]
+
+        co.submit_task(Task(task_id="child", depends_on=["parent"]))
+        assert _run_order(co) == ["child"]
+
+    def test_cancelled_blocked_task_is_not_released(self):
+        co = _coordinator()
+        co.submit_tasks([Task(task_id="parent"), Task(task_id="child", depends_on=["parent"])])
+        assert co.cancel_task("child")
+        assert co.get_coordinator_stats()["pending_tasks"] == 1
+
+        assert _run_order(co) == ["parent"]
+        assert co.get_task_status("child") == TaskStatus.CANCELLED
+        assert co.get_coordinator_stats()["pending_tasks"] == 0
+
+
+class TestWaiters:
+    def test_waiters_wake_on_completion(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="t"))
+        co._schedule_tasks()
+
+        results = []
+        waiters = [
+            threading.Thread(target=lambda: results.append(co.wait_for_task("t", timeout=5)))
+            for _ in range(4)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        while co._completion_waiters["t"] < len(waiters):
+            time.sleep(0.001)
+
+        _finish(co, "t")
+        for waiter in waiters:
+            waiter.join(timeout=5)
+
+        assert len(results) == 4
+        assert all(r.status == TaskStatus.COMPLETED for r in results)
+        assert not co._completion_events
+        assert not co._completion_waiters
+
+    def test_finished_task_returns_without_waiting(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="t"))
+        co._schedule_tasks()
+        _finish(co, "t", TaskStatus.FAILED)
+
+        assert co.wait_for_task("t", timeout=0).status == TaskStatus.FAILED
+        assert not co._completion_events
+
+    def test_timed_out_wait_leaves_nothing_behind(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="t"))
+
+        assert co.wait_for_task("t", timeout=0.01) is None
+        assert co.wait_for_task("unknown", timeout=0.01) is None
+        assert co.wait_for_tasks(["t", "unknown"], timeout=0.01) == {}
+        assert not co._completion_events
+        assert not co._completion_waiters
+
+
+class TestRetention:
+    def test_oldest_finished_tasks_are_forgotten(self):
+        co = _coordinator(max_retained_completions=2)
+        co.submit_tasks([Task(task_id=f"t{i}") for i in range(4)])
+        _run_order(co)
+
+        assert [co.get_task(f"t{i}") is not None for i in range(4)] == [False, False, True, True]
+        assert co.get_result("t0") is None
+        assert co.get_result("t3").status == TaskStatus.COMPLETED
+        assert co.get_coordinator_stats()["completed_tasks"] == 4
+        assert co.list_tasks(status=TaskStatus.COMPLETED) == [co.get_task("t2"), co.get_task("t3")]
+
+    def test_resubmitted_unfinished_task_is_kept(self):
+        co = _coordinator(agents=2, max_retained_completions=1)
+        co.submit_task(Task(task_id="x"))
+        _run_order(co)
+
+        co.submit_task(Task(task_id="x"))
+        co.submit_task(Task(task_id="y"))
+        co._schedule_tasks()
+        _finish(co, "y")
+
+        task = co.get_task("x")
+        assert task is not None and task.status == TaskStatus.ASSIGNED
+        assert co.list_tasks(status=TaskStatus.ASSIGNED) == [task]
+        _finish(co, "x")
+        assert co.get_task_status("x") == TaskStatus.COMPLETED
+
+
+def _ids(tasks: list[Task]) -> list[str]:
+    return [task.task_id for task in tasks]
+
+
+class TestTaskIndexes:
+    def test_filters_follow_status_changes(self):
+        co = _coordinator(agents=2)
+        co.submit_tasks([Task(task_id=f"t{i}") for i in range(4)])
+        co.cancel_task("t3")
+        co._schedule_tasks()
+
+        assert _ids(co.list_tasks(status=TaskStatus.ASSIGNED)) == ["t0", "t1"]
+        assert _ids(co.list_tasks(status=TaskStatus.PENDING)) == ["t2"]
+        assert _ids(co.list_tasks(status=TaskStatus.CANCELLED)) == ["t3"]
+        for task_id, agent_id in co._running_tasks.items():
+            assert _ids(co.list_tasks(agent_id=agent_id)) == [task_id]
+
+        _finish(co, "t1")
+        assert _ids(co.list_tasks(status=TaskStatus.ASSIGNED)) == ["t0"]
+        assert _ids(co.list_tasks(status=TaskStatus.COMPLETED)) == ["t1"]
+        assert _ids(co.list_tasks()) == ["t0", "t1", "t2", "t3"]
+
+    def test_combined_filters(self):
+        co = _coordinator()
+        co.submit_tasks([Task(task_id="a"), Task(task_id="b")])
+        co._schedule_tasks()
+        agent_id = co._running_tasks["a"]
+        _finish(co, "a")
+        co._schedule_tasks()
+
+        assert _ids(co.list_tasks(agent_id=agent_id)) == ["a", "b"]
+        assert _ids(co.list_tasks(status=TaskStatus.COMPLETED, agent_id=agent_id)) == ["a"]
+        assert co.list_tasks(status=TaskStatus.COMPLETED, agent_id="nobody") == []
+
+    def test_retry_clears_assignment(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="t", timeout=-1.0, max_retries=1))
+        co._schedule_tasks()
+        agent_id = co._running_tasks["t"]
+        co._monitor_tasks()
+
+        assert _ids(co.list_tasks(status=TaskStatus.RETRYING)) == ["t"]
+        assert co.list_tasks(agent_id=agent_id) == []
+
+    def test_resubmission_replaces_indexed_task(self):
+        co = _coordinator()
+        co.submit_task(Task(task_id="t"))
+        co.cancel_task("t")
+        co.submit_task(Task(task_id="t"))
+
+        assert co.list_tasks(status=TaskStatus.CANCELLED) == []
+        assert co.list_tasks(status=TaskStatus.PENDING) == [co.get_task("t")]
@@ -0,0 +1,103 @@
+"""Tests for the agent lifecycle manager's instance bookkeeping."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+
+from indestructibleautoops.agents.base import Agent
+from indestructibleautoops.agents.communication import AgentCommunicationBus
+from indestructibleautoops.agents.lifecycle import AgentLifecycle, AgentState
+from indestructibleautoops.agents.registry import AgentRegistry
+
+
+class _Worker(Agent):
+    def __init__(self, agent_id: str, config: dict | None = None):
+        super().__init__(agent_id, [], config)
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def execute_task(self, task, context):
+        return {}
+
+
+class _BrokenWorker(_Worker):
+    async def initialize(self):
+        raise RuntimeError("cannot start")
+
+
+def _lifecycle(**kwargs) -> AgentLifecycle:
+    lifecycle = AgentLifecycle(AgentRegistry(), AgentCommunicationBus(), **kwargs)
+    lifecycle.register_agent_type("worker", _Worker)
+    lifecycle.register_agent_type("builder", _Worker)
+    lifecycle.register_agent_type("broken", _BrokenWorker)
+    return lifecycle
+
+
+def _assert_counts_match(lifecycle: AgentLifecycle) -> dict:
+    """Check the incremental counts against a scan of the instances."""
+    stats = lifecycle.get_lifecycle_stats()
+    instances = lifecycle.list_instances()
+    by_state = Counter(instance.state.value for instance in instances)
+    assert stats["by_state"] == {state.value: by_state[state.value] for state in AgentState}
+    assert stats["by_type"] == dict(Counter(instance.agent_type for instance in instances))
+    assert stats["total_instances"] == len(instances)
+    return stats
+
+
+class TestLifecycleCounts:
+    def test_spawned_agents_are_counted(self):
+        lifecycle = _lifecycle()
+        specs = [
+            ("worker", "w1", None, None),
+            ("worker", "w2", None, None),
+            ("builder", "b1", None, None),
+            ("broken", "x1", None, None),
+        ]
+        instances = asyncio.run(lifecycle.spawn_agents(specs, max_concurrent_spawns=2))
+
+        assert len(instances) == 3
+        stats = _assert_counts_match(lifecycle)
+        assert stats["by_state"]["ready"] == 3
+        assert stats["by_type"] == {"worker": 2, "builder": 1}
+
+    def test_failed_spawn_is_not_counted(self):
+        lifecycle = _lifecycle()
+        with pytest.raises(RuntimeError):
+            asyncio.run(lifecycle.spawn_agent("broken", "x1"))
+
+        stats = _assert_counts_match(lifecycle)
+        assert stats["total_instances"] == 0
+        assert stats["by_type"] == {}
+
+    def test_stale_agents_move_to_error(self):
+        lifecycle = _lifecycle(heartbeat_interval=0.01)
+        asyncio.run(lifecycle.spawn_agent("worker", "w1"))
+        asyncio.run(lifecycle.spawn_agent("worker", "w2"))
+        lifecycle.get_instance("w1").last_heartbeat = time.time() - 60
+
+        lifecycle._check_heartbeats()
+
+        assert lifecycle.get_state("w1") == AgentState.ERROR
+        assert lifecycle.get_state("w2") == AgentState.READY
+        stats = _assert_counts_match(lifecycle)
+        assert (stats["by_state"]["error"], stats["by_state"]["ready"]) == (1, 1)
+
+    def test_terminated_agents_are_uncounted(self):
+        lifecycle = _lifecycle()
+        asyncio.run(lifecycle.spawn_agent("worker", "w1"))
+        asyncio.run(lifecycle.spawn_agent("builder", "b1"))
+
+        assert asyncio.run(lifecycle.terminate_agent("b1", graceful=False))
+
+        stats = _assert_counts_match(lifecycle)
+        assert stats["by_type"] == {"worker": 1}
+        assert stats["by_state"]["terminated"] == 0
+        assert lifecycle.get_instance("b1") is None
@@ -0,0 +1,120 @@
+"""Tests for the delivery agent's CI config generation and custom templates."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+from indestructibleautoops.agents.concrete import delivery
+from indestructibleautoops.agents.concrete.delivery import DeliveryAgent
+
+
+def _generate_ci_config(agent: DeliveryAgent, provider: str = "github") -> dict:
+    task = {
+        "task_type": "generate_ci_config",
+        "payload": {
+            "project_snapshot": {"project_root": "/repo", "file_index": {"pyproject.toml": {}}},
+            "provider": provider,
+        },
+    }
+    return asyncio.run(agent.execute_task(task, {}))
+
+
+class TestGenerateCIConfig:
+    def test_renders_provider_template(self):
+        result = _generate_ci_config(DeliveryAgent("delivery"))
+        assert result["success"]
+        (patch,) = result["patch_set"]["patches"]
+        assert patch["file_path"] == ".github/workflows/ci.yml"
+        assert patch["content"]
+
+    def test_unusable_state_dir_does_not_fail(self, tmp_path: Path):
+        state_file = tmp_path / "not-a-dir"
+        state_file.write_text("", encoding="utf-8")
+        agent = DeliveryAgent("delivery", {"state_dir": str(state_file)})
+
+        result = _generate_ci_config(agent)
+        assert result["success"]
+        assert result["patch_set"]["patches"][0]["content"]
+        assert list(tmp_path.iterdir()) == [state_file]
+
+
+def _initialize(agent: DeliveryAgent) -> None:
+    asyncio.run(agent.initialize())
+
+
+def _template_keys(agent: DeliveryAgent, provider: str) -> set[str]:
+    return {template["key"] for template in agent.list_templates(provider)}
+
+
+class TestCustomTemplates:
+    def test_loads_templates_and_skips_bad_files(self, tmp_path: Path):
+        github = tmp_path / "github"
+        github.mkdir()
+        (github / "good.json").write_text('{"content": "run: ${cmd}"}', encoding="utf-8")
+        (github / "bad.yaml").write_text("content: [unclosed\n", encoding="utf-8")
+        (github / "binary.yml").write_bytes(b"\xff\xfe")
+
+        agent = DeliveryAgent("delivery", {"templates_dir": str(tmp_path)})
+        _initialize(agent)
+
+        keys = _template_keys(agent, "github")
+        assert "github:good" in keys
+        assert "github:bad" not in keys
+        assert "github:binary" not in keys
+
+    def test_missing_templates_dir_is_skipped(self, tmp_path: Path):
+        agent = DeliveryAgent("delivery", {"templates_dir": str(tmp_path / "missing")})
+        _initialize(agent)
+        assert _template_keys(agent, "github") == _template_keys(DeliveryAgent("d"), "github")
+
+    def test_unreadable_subdirectory_is_skipped(self, tmp_path: Path, monkeypatch):
+        (tmp_path / "github").mkdir()
+        (tmp_path / "github" / "ok.json").write_text('{"content": "x"}', encoding="utf-8")
+        locked = tmp_path / "gitlab"
+        locked.mkdir()
+
+        scandir = os.scandir
+
+        def guarded_scandir(path):
+            if os.fspath(path) == str(locked):
+                raise PermissionError(13, "Permission denied", str(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", guarded_scandir)
+        agent = DeliveryAgent("delivery", {"templates_dir": str(tmp_path)})
+        _initialize(agent)
+
+        assert "github:ok" in _template_keys(agent, "github")
+
+
+class TestJSONCache:
+    def test_stdlib_fallback_matches_orjson_bytes(self, monkeypatch):
+        data = {"note": "héllo ✓", "values": [1, 2.5, None, True]}
+        expected = '{"note":"héllo ✓","values":[1,2.5,null,true]}'.encode()
+        assert delivery._dumps(data) == expected
+
+        monkeypatch.setattr(delivery, "orjson", None)
+        assert delivery._dumps(data) == expected
+
+    def test_encoding_is_reused(self):
+        agent = DeliveryAgent("delivery")
+        task = {
+            "task_type": "create_attestation",
+            "payload": {"attestation_type": "provenance", "data": {"note": "héllo"}},
+        }
+        attestation_id = asyncio.run(agent.execute_task(task, {}))["attestation"]["attestation_id"]
+
+        encoded = agent.get_attestation_json(attestation_id)
+        assert json.loads(encoded) == agent.get_attestation(attestation_id).to_dict()
+        assert agent.get_attestation_json(attestation_id) is encoded
+
+    def test_cache_keeps_most_recent_encodings(self):
+        agent = DeliveryAgent("delivery", {"json_cache_size": 2})
+        patch_ids = [_generate_ci_config(agent)["patch_set"]["patch_id"] for _ in range(3)]
+        for patch_id in patch_ids:
+            assert agent.get_patch_set_json(patch_id) is not None
+
+        assert list(agent._json_cache) == patch_ids[1:]
@@ -0,0 +1,37 @@
+"""Tests for the observability agent's metric history."""
+
+from __future__ import annotations
+
+import time
+
+from indestructibleautoops.agents.concrete.observability import Metric, ObservabilityAgent
+
+
+def _metric(i: int) -> Metric:
+    return Metric(
+        metric_id=f"m{i}",
+        name=f"metric_{i % 3}",
+        value=float(i),
+        unit="count",
+        timestamp=time.time(),
+    )
+
+
+class TestMetricHistoryBound:
+    def test_time_queries_only_return_retained_metrics(self):
+        agent = ObservabilityAgent("obs", {"max_metrics": 100})
+        for i in range(5000):
+            agent.add_metric(_metric(i))
+
+        history = agent.get_metrics(limit=10_000)
+        assert len(history) == 100
+        assert agent.get_metrics(since=0, limit=10_000) == history
+
+    def test_time_queries_by_name_match_history(self):
+        agent = ObservabilityAgent("obs", {"max_metrics": 10})
+        for i in range(50):
+            agent.add_metric(_metric(i))
+
+        by_name = agent.get_metrics(name="metric_1", since=0, limit=100)
+        assert by_name == agent.get_metrics(name="metric_1", limit=100)
+        assert [m.metric_id for m in by_name] == ["m40", "m43", "m46", "m49"]
@@ -0,0 +1,136 @@
+"""Tests for the policy agent's compliance checks and policy evaluation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from indestructibleautoops.agents.concrete.policy import PolicyAgent
+from indestructibleautoops.agents.policy_engine import Policy, PolicySeverity
+
+
+def _check_compliance(agent: PolicyAgent, standards: list[str], context: dict) -> dict:
+    task = {
+        "task_type": "check_compliance",
+        "payload": {"standards": standards, "context": context},
+    }
+    return asyncio.run(agent.execute_task(task, {}))
+
+
+class TestCompliance:
+    def test_reports_each_check(self):
+        result = _check_compliance(
+            PolicyAgent("policy"),
+            ["SOC2", "GDPR", "UNKNOWN"],
+            {"audit_logging_enabled": True, "access_controls_enabled": True},
+        )
+
+        assert result["all_compliant"] is False
+        soc2 = result["compliance_results"]["SOC2"]
+        assert soc2["compliant"] is True
+        assert [(c["check"], c["passed"]) for c in soc2["checks"]] == [
+            ("audit_logging", True),
+            ("access_controls", True),
+        ]
+        assert result["compliance_results"]["GDPR"]["compliant"] is False
+        assert result["compliance_results"]["UNKNOWN"] == {
+            "compliant": True,
+            "standard": "UNKNOWN",
+            "checks": [],
+        }
+
+    def test_responses_do_not_share_state(self):
+        agent = PolicyAgent("policy")
+        first = _check_compliance(agent, ["SOC2"], {})
+        soc2 = first["compliance_results"]["SOC2"]
+        soc2["checks"][0]["passed"] = True
+        soc2["checks"].clear()
+        soc2["compliant"] = True
+
+        for other in (agent, PolicyAgent("other")):
+            again = _check_compliance(other, ["SOC2"], {})["compliance_results"]["SOC2"]
+            assert again["compliant"] is False
+            assert [c["passed"] for c in again["checks"]] == [False, False]
+
+    def test_fast_fail_skips_remaining_standards(self):
+        agent = PolicyAgent("policy", {"fast_fail_compliance": True})
+        result = _check_compliance(
+            agent, ["GDPR", "SOC2", "HIPAA"], {"audit_logging_enabled": True}
+        )["compliance_results"]
+
+        assert result["GDPR"]["compliant"] is False
+        assert "skipped" not in result["GDPR"]
+        assert result["SOC2"] == {
+            "compliant": False,
+            "standard": "SOC2",
+            "checks": [],
+            "skipped": True,
+        }
+        assert result["HIPAA"]["skipped"] is True
+
+    def test_without_fast_fail_checks_every_standard(self):
+        result = _check_compliance(PolicyAgent("policy"), ["GDPR", "SOC2"], {})
+        assert all("skipped" not in r for r in result["compliance_results"].values())
+
+
+_INDEXED_POLICIES = [
+    Policy(policy_id="env-prod", conditions={"env": "prod"}),
+    Policy(policy_id="env-not-dev", conditions={"env": {"ne": "dev"}}),
+    Policy(policy_id="replicas", conditions={"replicas": {"gte": 2, "lte": 10}}),
+    Policy(policy_id="region", conditions={"region": {"in": ["eu", "us"]}}),
+    Policy(policy_id="no-root", conditions={"user": {"not_in": ["root"]}}),
+    Policy(policy_id="nested", conditions={"deploy.strategy": {"eq": "canary"}}),
+    Policy(policy_id="image", conditions={"image": {"not_contains": "latest"}}),
+    Policy(policy_id="pattern", rule_pattern="secret"),
+    Policy(
+        policy_id="blocking",
+        severity=PolicySeverity.ERROR,
+        actions=["block"],
+        conditions={"approved": True},
+    ),
+    Policy(policy_id="disabled", enabled=False, conditions={"env": "prod"}),
+]
+
+
+@pytest.mark.parametrize(
+    "context",
+    [
+        {},
+        {"env": "prod"},
+        {"env": "dev", "user": "root"},
+        {"replicas": 1, "region": "ap"},
+        {"replicas": 5, "region": "eu", "approved": True},
+        {"deploy": {"strategy": "canary"}},
+        {"deploy": "canary"},
+        {"image": "app:latest", "note": "secret"},
+        {"unrelated": 1},
+    ],
+)
+def test_candidate_policies_match_full_evaluation(context):
+    agent = PolicyAgent("policy")
+    agent.add_policies(list(_INDEXED_POLICIES))
+    engine = agent._policy_engine
+
+    full = engine.evaluate_action(agent_id="a", action="execute", context=context)
+    narrowed = engine.evaluate_action(
+        agent_id="a",
+        action="execute",
+        context=context,
+        candidate_policy_ids=agent._candidate_policy_ids(context),
+    )
+
+    assert narrowed[0] == full[0]
+    assert [v.policy_id for v in narrowed[1]] == [v.policy_id for v in full[1]]
+
+
+def test_policies_passing_on_absent_keys_are_skipped():
+    agent = PolicyAgent("policy")
+    agent.add_policies(list(_INDEXED_POLICIES))
+
+    candidates = agent._candidate_policy_ids({"unrelated": 1})
+    assert {"env-not-dev", "no-root", "image"}.isdisjoint(candidates)
+    # Fails when env is missing, so it is checked for every context
+    assert "env-prod" in candidates
+    assert "pattern" in candidates
+    assert "env-not-dev" in agent._candidate_policy_ids({"env": "dev"})
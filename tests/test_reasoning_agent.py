@@ -0,0 +1,63 @@
+"""Tests for the reasoning agent's repair plans and their persistence."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from indestructibleautoops.agents.concrete.reasoning import ReasoningAgent
+
+
+def _create_plan(agent: ReasoningAgent, files: list[str]) -> dict:
+    task = {
+        "task_type": "create_repair_plan",
+        "payload": {
+            "project_snapshot": {
+                "project_root": "/repo",
+                "file_index": {path: {} for path in files},
+            },
+        },
+    }
+    result = asyncio.run(agent.execute_task(task, {}))
+    assert result["success"]
+    return result["repair_plan"]
+
+
+class TestPlanPersistence:
+    def test_plans_survive_restart(self, tmp_path: Path):
+        config = {"state_dir": str(tmp_path)}
+        agent = ReasoningAgent("reasoning", config)
+        asyncio.run(agent.initialize())
+        first = _create_plan(agent, ["app.py", "secrets.pem"])
+        second = _create_plan(agent, ["README.md", "LICENSE", "requirements.txt"])
+        asyncio.run(agent.shutdown())
+
+        assert [p.name for p in tmp_path.iterdir()] == ["plans.json"]
+
+        restarted = ReasoningAgent("reasoning", config)
+        asyncio.run(restarted.initialize())
+        loaded = {plan.plan_id: plan.to_dict() for plan in restarted.list_plans()}
+        assert loaded == {first["plan_id"]: first, second["plan_id"]: second}
+
+    def test_save_replaces_previous_file(self, tmp_path: Path):
+        config = {"state_dir": str(tmp_path / "state")}
+        agent = ReasoningAgent("reasoning", config)
+        _create_plan(agent, ["app.py"])
+        asyncio.run(agent.shutdown())
+        _create_plan(agent, ["main.go"])
+        asyncio.run(agent.shutdown())
+
+        data = json.loads((tmp_path / "state" / "plans.json").read_text(encoding="utf-8"))
+        assert len(data["plans"]) == 2
+        assert [p.name for p in (tmp_path / "state").iterdir()] == ["plans.json"]
+
+    def test_missing_or_corrupt_state_starts_empty(self, tmp_path: Path):
+        agent = ReasoningAgent("reasoning", {"state_dir": str(tmp_path / "missing")})
+        asyncio.run(agent.initialize())
+        assert agent.list_plans() == []
+
+        (tmp_path / "plans.json").write_text("{not json", encoding="utf-8")
+        agent = ReasoningAgent("reasoning", {"state_dir": str(tmp_path)})
+        asyncio.run(agent.initialize())
+        assert agent.list_plans() == []
@@ -19,21 +19,34 @@ def test_build_sign_commands_are_emitted(tmp_path: Path):
     sbom_result = generate_sbom(image, output_path=str(sbom_path), dry_run=True)
     assert sbom_result.command[0] == "syft"
 
-    sign_result = sign_image(image, key_ref="cosign.key", annotations={"owner": "platform"}, dry_run=True)
+    sign_result = sign_image(
+        image, key_ref="cosign.key", annotations={"owner": "platform"}, dry_run=True
+    )
     assert "--key" in sign_result.command
     assert any(item.startswith("owner=") for item in sign_result.command if "owner=" in item)
 
 
 def test_verify_gate_accepts_valid_sbom(tmp_path: Path):
     sbom_path = tmp_path / "sbom.json"
-    sbom_path.write_text(json.dumps({"components": [{"name": "demo", "version": "1.0.0"}]}), encoding="utf-8")
+    sbom_path.write_text(
+        json.dumps({"components": [{"name": "demo", "version": "1.0.0"}]}), encoding="utf-8"
+    )
     assert verify_sbom(str(sbom_path))
 
 
 def test_dependency_gate_flags_critical(tmp_path: Path):
     sbom = {
-        "components": [{"bom-ref": "pkg:demo", "name": "demo", "version": "1.0.0", "licenses": [{"license": {"name": "Apache-2.0"}}]}],
-        "vulnerabilities": [{"id": "CVE-TEST", "severity": "critical", "affects": [{"ref": "pkg:demo"}]}],
+        "components": [
+            {
+                "bom-ref": "pkg:demo",
+                "name": "demo",
+                "version": "1.0.0",
+                "licenses": [{"license": {"name": "Apache-2.0"}}],
+            }
+        ],
+        "vulnerabilities": [
+            {"id": "CVE-TEST", "severity": "critical", "affects": [{"ref": "pkg:demo"}]}
+        ],
     }
     findings = evaluate_dependencies(sbom, allowed_licenses={"Apache-2.0"})
     total, blockers = summarize(findings)